@@ -1,13 +1,21 @@
 """Binary sensor platform for Is There a Seattle Home Game Today?"""
 
-from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from collections import defaultdict
+from homeassistant.util import dt as dt_util
+from time import perf_counter
 
-from .const import DOMAIN
+from .const import DOMAIN, CONF_LEAN_ATTRIBUTES, DEFAULT_LEAN_ATTRIBUTES
+from .entity import SeattleHomeGameTimelineEntity
+from .index import EventIndex
+
+# Shown once the last data is for a past day
+_NO_EVENTS = ()
 
 
 async def async_setup_entry(
@@ -18,32 +26,50 @@ async def async_setup_entry(
     """Set up Seattle Home Game binary sensor."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities([SeattleHomeGameBinarySensor(coordinator)])
+    async_add_entities(
+        [
+            SeattleHomeGameBinarySensor(coordinator),
+            GameInProgressBinarySensor(coordinator),
+            TrafficImpactBinarySensor(coordinator, soon=False),
+            TrafficImpactBinarySensor(coordinator, soon=True),
+        ]
+    )
 
 
-class SeattleHomeGameBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class SeattleHomeGameBinarySensor(SeattleHomeGameTimelineEntity, BinarySensorEntity):
     """Seattle home game binary sensor."""
 
+    # The full event list is available through the get_events service
+    _unrecorded_attributes = frozenset({"events"})
+
     def __init__(self, coordinator):
         """Initialize the sensor."""
         super().__init__(coordinator)
+        self._lean = coordinator.entry.options.get(
+            CONF_LEAN_ATTRIBUTES, DEFAULT_LEAN_ATTRIBUTES
+        )
         self._attr_name = "Is There a Seattle Home Game Today?"
         self._attr_unique_id = f"{coordinator.entry.entry_id}_home_game_today"
+        self._attributes = None
+        self._attributes_events = None
 
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
-            "name": "Seattle Home Game Monitor",
-            "manufacturer": "isthereaseattlehomegametoday.com",
-            "entry_type": "service",
-        }
+    def _rendered_state(self):
+        """Return the fields the state and attributes are built from."""
+        if not self.coordinator.data:
+            return None
+        return (
+            tuple(self.coordinator.data.get("events", [])),
+            self.coordinator.stale_since,
+            self.coordinator.outdated,
+        )
 
     @property
     def is_on(self):
         """Return true if there are events today."""
         if not self.coordinator.data:
             return None
+        if self.coordinator.outdated:
+            return False
         return self.coordinator.data.get("events_found", False)
 
     @property
@@ -62,31 +88,7 @@ class SeattleHomeGameBinarySensor(CoordinatorEntity, BinarySensorEntity):
         else:
             return "with no time or venue listed"
 
-    def _group_events(self, events):
-        """Group events by venue and time for more natural summaries."""
-        # Group by venue
-        by_venue = defaultdict(list)
-        no_venue = []
-
-        for event in events:
-            venue = event.get("venue")
-            if venue:
-                by_venue[venue].append(event)
-            else:
-                no_venue.append(event)
-
-        # Further group by time within each venue
-        venue_time_groups = {}
-        for venue, venue_events in by_venue.items():
-            time_groups = defaultdict(list)
-            for event in venue_events:
-                time = event.get("time", "No time")
-                time_groups[time].append(event)
-            venue_time_groups[venue] = time_groups
-
-        return venue_time_groups, no_venue
-
-    def _generate_summary(self, events):
+    def _generate_summary(self, events, index=None):
         """Generate a human-readable summary of events."""
         if not events:
             return "There are no events today"
@@ -96,8 +98,8 @@ class SeattleHomeGameBinarySensor(CoordinatorEntity, BinarySensorEntity):
         # Single event case
         if event_count == 1:
             event = events[0]
-            time = event.get("time")
-            venue = event.get("venue")
+            time = event.time
+            venue = event.venue
 
             if time and venue:
                 return f"There is one event today at {venue}, starting at {time}"
@@ -108,8 +110,10 @@ class SeattleHomeGameBinarySensor(CoordinatorEntity, BinarySensorEntity):
             else:
                 return "There is one event today"
 
-        # Multiple events
-        venue_time_groups, no_venue = self._group_events(events)
+        # Multiple events, grouped by venue and time
+        if index is None:
+            index = EventIndex(events)
+        venue_time_groups, no_venue = index.by_venue_time, index.no_venue
 
         # Check if all events are at the same venue
         if len(venue_time_groups) == 1 and not no_venue:
@@ -124,15 +128,11 @@ class SeattleHomeGameBinarySensor(CoordinatorEntity, BinarySensorEntity):
                 else:
                     return f"There are {event_count} events today at {venue}"
             else:
-                # Same venue, different times
+                # Same venue, different times, which the index keeps in the
+                # chronological order of the events
                 times_with_events = [
                     (t, len(evts)) for t, evts in time_groups.items() if t != "No time"
                 ]
-                times_with_events.sort(
-                    key=lambda x: events[
-                        next(i for i, e in enumerate(events) if e.get("time") == x[0])
-                    ].get("datetime")
-                )
 
                 if times_with_events:
                     time_parts = []
@@ -158,13 +158,13 @@ class SeattleHomeGameBinarySensor(CoordinatorEntity, BinarySensorEntity):
         all_times = []
         for venue_events in venue_time_groups.values():
             all_times.extend([t for t in venue_events.keys() if t != "No time"])
-        all_times.extend([e.get("time") for e in no_venue if e.get("time")])
+        all_times.extend([e.time for e in no_venue if e.time])
 
         unique_times = list(set(all_times))
         if (
             len(unique_times) == 1
             and unique_times[0]
-            and not any(e for e in events if not e.get("time"))
+            and not any(e for e in events if not e.time)
         ):
             # All at same time, different venues
             time = unique_times[0]
@@ -181,10 +181,7 @@ class SeattleHomeGameBinarySensor(CoordinatorEntity, BinarySensorEntity):
         parts = []
 
         # Group venues by number of events for better readability
-        venue_counts = [
-            (v, sum(len(events) for events in tg.values()))
-            for v, tg in venue_time_groups.items()
-        ]
+        venue_counts = [(v, len(evts)) for v, evts in index.by_venue.items()]
         venue_counts.sort(key=lambda x: x[1], reverse=True)
 
         # If there are 2 or fewer venues, we can be more detailed
@@ -222,7 +219,7 @@ class SeattleHomeGameBinarySensor(CoordinatorEntity, BinarySensorEntity):
             venue_str = f"{venues_mentioned} different venues"
 
         # Count events with times
-        events_with_time = sum(1 for e in events if e.get("time"))
+        events_with_time = sum(1 for e in events if e.time)
 
         if events_with_time == event_count:
             if len(unique_times) <= 2:
@@ -235,14 +232,118 @@ class SeattleHomeGameBinarySensor(CoordinatorEntity, BinarySensorEntity):
         else:
             return f"There are {event_count} events today at {venue_str}"
 
+    def _attributes_for(self, events, index):
+        """Build the attributes once per coordinator data version."""
+        if self._attributes_events is not events:
+            start = perf_counter()
+            self._attributes = {
+                "event_count": len(events),
+                "summary": self._generate_summary(events, index),
+            }
+            if not self._lean:
+                self._attributes["events"] = [event.as_dict() for event in events]
+            self._attributes_events = events
+            self.coordinator.stats.attributes_ms = (perf_counter() - start) * 1000
+        return self._attributes
+
     @property
     def extra_state_attributes(self):
         """Return extra attributes."""
         if not self.coordinator.data:
             return None
-        events = self.coordinator.data.get("events", [])
-        return {
-            "event_count": len(events),
-            "events": events,
-            "summary": self._generate_summary(events),
+        data = self.coordinator.data
+        if self.coordinator.outdated:
+            # The last data is for a past day, so none of its events are today's
+            attrs = dict(self._attributes_for(_NO_EVENTS, None))
+        else:
+            attrs = dict(
+                self._attributes_for(data.get("events", []), data.get("index"))
+            )
+        attrs["outdated"] = self.coordinator.outdated
+        stale_since = self.coordinator.stale_since
+        attrs["stale"] = stale_since is not None
+        if stale_since is not None:
+            attrs["stale_since"] = stale_since.isoformat()
+        return attrs
+
+
+class GameInProgressBinarySensor(SeattleHomeGameTimelineEntity, BinarySensorEntity):
+    """On from an event's start until its estimated end."""
+
+    _attr_device_class = BinarySensorDeviceClass.RUNNING
+
+    def __init__(self, coordinator):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_name = "Game In Progress"
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_game_in_progress"
+
+    def _in_progress(self):
+        """Return the events under way right now."""
+        return self.coordinator.timeline.in_progress(dt_util.now())
+
+    def _rendered_state(self):
+        """Return the events under way right now."""
+        return tuple(event.key for event in self._in_progress())
+
+    @property
+    def is_on(self):
+        """Return true while an event is under way."""
+        return bool(self._in_progress())
+
+    @property
+    def icon(self):
+        """Return the icon."""
+        return "mdi:stadium-variant" if self.is_on else "mdi:stadium-outline"
+
+    @property
+    def extra_state_attributes(self):
+        """Return the events under way."""
+        return {"events": [event.name for event in self._in_progress()]}
+
+
+class TrafficImpactBinarySensor(SeattleHomeGameTimelineEntity, BinarySensorEntity):
+    """On while game traffic is expected now, or within the look-ahead."""
+
+    def __init__(self, coordinator, soon):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._soon = soon
+        if soon:
+            self._attr_name = "Traffic Impacted Soon"
+            self._attr_unique_id = f"{coordinator.entry.entry_id}_traffic_impacted_soon"
+        else:
+            self._attr_name = "Traffic Impacted"
+            self._attr_unique_id = f"{coordinator.entry.entry_id}_traffic_impacted"
+
+    def _rendered_state(self):
+        """Return the state and the window it refers to."""
+        return (self.is_on, self.coordinator.timeline.traffic.next_window(dt_util.now()))
+
+    @property
+    def is_on(self):
+        """Return true if traffic is impacted."""
+        timeline = self.coordinator.timeline
+        now = dt_util.now()
+        if self._soon:
+            return timeline.traffic.impacted_within(now, timeline.traffic_lookahead)
+        return timeline.traffic.window_at(now) is not None
+
+    @property
+    def icon(self):
+        """Return the icon."""
+        return "mdi:car-multiple" if self.is_on else "mdi:car"
+
+    @property
+    def extra_state_attributes(self):
+        """Return the current or next traffic window."""
+        window = self.coordinator.timeline.traffic.next_window(dt_util.now())
+        attrs = {
+            "window_start": window[0].isoformat() if window else None,
+            "window_end": window[1].isoformat() if window else None,
         }
+        if self._soon:
+            attrs["lookahead_minutes"] = int(
+                self.coordinator.timeline.traffic_lookahead.total_seconds() // 60
+            )
+        return attrs
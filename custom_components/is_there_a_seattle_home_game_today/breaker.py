@@ -0,0 +1,51 @@
+"""Circuit breaker for Seattle Home Game Monitor."""
+
+from time import monotonic
+
+
+class CircuitBreaker:
+    """Stop calling a failing upstream and probe it on a backoff schedule."""
+
+    def __init__(
+        self, failure_threshold: int, backoff_base: float, backoff_max: float
+    ) -> None:
+        """Initialize a closed breaker."""
+        self.failure_threshold = failure_threshold
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failures = 0
+        self._opened = 0
+        self._retry_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return true while requests are being held back."""
+        return self._retry_at is not None
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next probe is allowed."""
+        if self._retry_at is None:
+            return 0.0
+        return max(self._retry_at - monotonic(), 0.0)
+
+    def allow_request(self) -> bool:
+        """Return true if a request may be made now."""
+        # Once the backoff has passed a single probe is let through, its
+        # outcome either closes the breaker or opens it for longer
+        return self._retry_at is None or monotonic() >= self._retry_at
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        self.failures = 0
+        self._opened = 0
+        self._retry_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the breaker once the threshold is reached."""
+        self.failures += 1
+        if self.failures < self.failure_threshold:
+            return
+        backoff = min(self.backoff_base * 2**self._opened, self.backoff_max)
+        self._opened += 1
+        self._retry_at = monotonic() + backoff
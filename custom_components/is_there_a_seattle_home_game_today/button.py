@@ -4,9 +4,9 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .entity import SeattleHomeGameEntity
 
 
 async def async_setup_entry(
@@ -19,7 +19,7 @@ async def async_setup_entry(
     async_add_entities([RefreshButton(coordinator)])
 
 
-class RefreshButton(CoordinatorEntity, ButtonEntity):
+class RefreshButton(SeattleHomeGameEntity, ButtonEntity):
     """Button to manually refresh data."""
 
     def __init__(self, coordinator):
@@ -29,15 +29,10 @@ class RefreshButton(CoordinatorEntity, ButtonEntity):
         self._attr_unique_id = f"{coordinator.entry.entry_id}_refresh"
         self._attr_icon = "mdi:refresh"
 
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
-            "name": "Seattle Home Game Monitor",
-            "manufacturer": "isthereaseattlehomegametoday.com",
-            "entry_type": "service",
-        }
+    def _rendered_state(self):
+        """The button renders nothing from the coordinator."""
+        return None
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_manual_refresh()
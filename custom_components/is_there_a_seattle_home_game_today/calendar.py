@@ -0,0 +1,78 @@
+"""Calendar platform for Is There a Seattle Home Game Today?"""
+
+from datetime import date, datetime, timedelta
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .entity import SeattleHomeGameTimelineEntity
+from .models import Event
+from .schedule import event_span
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Seattle Home Game calendar."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([SeattleHomeGameCalendar(coordinator)])
+
+
+def _calendar_event(day: date, event: Event) -> CalendarEvent:
+    """Convert a scheduled event to a calendar event."""
+    if event.datetime:
+        start, end = event_span(day, event)
+    else:
+        # Events without a time are all-day events
+        start, end = day, day + timedelta(days=1)
+    return CalendarEvent(
+        start=start,
+        end=end,
+        summary=event.name,
+        description=event.description,
+        location=event.venue,
+        uid=f"{day.isoformat()}_{event.key}",
+    )
+
+
+class SeattleHomeGameCalendar(SeattleHomeGameTimelineEntity, CalendarEntity):
+    """Calendar of today's events, past daily snapshots and season files."""
+
+    def __init__(self, coordinator):
+        """Initialize the calendar."""
+        super().__init__(coordinator)
+        self._attr_name = "Seattle Home Games"
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_calendar"
+        self._attr_icon = "mdi:calendar-star"
+
+    def _current_or_next(self):
+        """Return the event under way, or else the next one to start."""
+        return self.coordinator.schedule.current_or_next(dt_util.now())
+
+    def _rendered_state(self):
+        """Return the schedule and the event shown as the state."""
+        return (self.coordinator.schedule, self._current_or_next())
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the event under way, or else the next one to start."""
+        if scheduled := self._current_or_next():
+            return _calendar_event(*scheduled)
+        return None
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the events between two times, from memory."""
+        return [
+            _calendar_event(day, event)
+            for day, event in self.coordinator.schedule.events_between(
+                start_date, end_date
+            )
+        ]
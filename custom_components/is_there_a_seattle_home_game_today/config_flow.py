@@ -1,10 +1,32 @@
 """Config flow for Is there a Seattle Home Game Today?"""
 
+import voluptuous as vol
+
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
-from .const import DOMAIN, API_URL
+from .const import (
+    DOMAIN,
+    API_URL,
+    DATA_SEED,
+    CONF_KEEP_RAW_EVENTS,
+    CONF_LEAN_ATTRIBUTES,
+    DEFAULT_KEEP_RAW_EVENTS,
+    DEFAULT_LEAN_ATTRIBUTES,
+    CONF_ARRIVAL_MINUTES,
+    CONF_EGRESS_MINUTES,
+    CONF_TRAFFIC_LOOKAHEAD,
+    DEFAULT_TRAFFIC_LOOKAHEAD,
+    CONF_SEASON_FILES,
+    DEFAULT_SEASON_FILES,
+    VALIDATE_FETCH_TIMEOUT,
+    VENUES,
+)
+from .fetch import FetchError, async_fetch
+from .parser import validate_payload
 
 
 class WebsiteMonitorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -12,6 +34,12 @@ class WebsiteMonitorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Return the options flow."""
+        return OptionsFlowHandler()
+
     async def async_step_user(self, user_input=None) -> FlowResult:
         """Handle the initial step."""
         await self.async_set_unique_id(DOMAIN)
@@ -20,21 +48,79 @@ class WebsiteMonitorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if user_input is not None:
-            # Validate URL
+            # Validate URL, once and briefly, retries could keep the form
+            # waiting for minutes
             try:
                 session = async_get_clientsession(self.hass)
-                response = await session.get(API_URL)
-                if response.status == 200:
-                    # Create entry
-                    return self.async_create_entry(
-                        title="Seattle Home Game Monitor",
-                        data=user_input,
-                    )
-                else:
-                    errors["base"] = "cannot_connect"
-            except Exception:
+                response = await async_fetch(
+                    session, API_URL, retries=0, timeout=VALIDATE_FETCH_TIMEOUT
+                )
+                payload = validate_payload(json_loads(response.body))
+            except FetchError:
                 errors["base"] = "cannot_connect"
+            except ValueError:
+                errors["base"] = "invalid_payload"
+            else:
+                # Hand the payload to the coordinator so setup needs no fetch
+                self.hass.data[DATA_SEED] = (response, payload)
+                return self.async_create_entry(
+                    title="Seattle Home Game Monitor",
+                    data=user_input,
+                )
 
         return self.async_show_form(
             step_id="user", errors=errors, description_placeholders={"api_url": API_URL}
         )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle options for Seattle Home Game Monitor."""
+
+    async def async_step_init(self, user_input=None) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        minutes = vol.All(vol.Coerce(int), vol.Range(min=0, max=720))
+        venue_schema = {}
+        for venue_id, (_name, arrival, egress) in VENUES.items():
+            arrival_key = CONF_ARRIVAL_MINUTES.format(venue_id)
+            egress_key = CONF_EGRESS_MINUTES.format(venue_id)
+            venue_schema[
+                vol.Optional(arrival_key, default=options.get(arrival_key, arrival))
+            ] = minutes
+            venue_schema[
+                vol.Optional(egress_key, default=options.get(egress_key, egress))
+            ] = minutes
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_KEEP_RAW_EVENTS,
+                        default=options.get(
+                            CONF_KEEP_RAW_EVENTS, DEFAULT_KEEP_RAW_EVENTS
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_LEAN_ATTRIBUTES,
+                        default=options.get(
+                            CONF_LEAN_ATTRIBUTES, DEFAULT_LEAN_ATTRIBUTES
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_TRAFFIC_LOOKAHEAD,
+                        default=options.get(
+                            CONF_TRAFFIC_LOOKAHEAD, DEFAULT_TRAFFIC_LOOKAHEAD
+                        ),
+                    ): minutes,
+                    **venue_schema,
+                    vol.Optional(
+                        CONF_SEASON_FILES,
+                        default=options.get(CONF_SEASON_FILES, DEFAULT_SEASON_FILES),
+                    ): str,
+                }
+            ),
+        )
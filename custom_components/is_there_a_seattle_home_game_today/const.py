@@ -1,13 +1,97 @@
 """Constants for Is There a Seattle Home Game Today?"""
 
 from datetime import timedelta
+from zoneinfo import ZoneInfo
 
 DOMAIN = "seattle_home_game"
 DEFAULT_NAME = "Is There a Seattle Home Game Today?"
 DEFAULT_SCAN_INTERVAL = timedelta(hours=1)
+FAST_SCAN_INTERVAL = timedelta(minutes=5)
+MAX_SCAN_INTERVAL = timedelta(hours=6)
+SCAN_INTERVAL_JITTER = 0.1
+PUBLISH_WINDOW_MARGIN = timedelta(minutes=30)
+# The window spans these quantiles of the observed publish times, so a single
+# late day does not keep it wide for the whole history
+PUBLISH_WINDOW_QUANTILES = (0.25, 0.75)
+PUBLISH_HISTORY_SIZE = 14
+
+EVENT_CACHE_SIZE = 256
+
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_BACKOFF_BASE = timedelta(minutes=5)
+BREAKER_BACKOFF_MAX = timedelta(hours=2)
+
+MIN_MANUAL_REFRESH_INTERVAL = timedelta(minutes=1)
+OUTBOUND_REQUEST_BURST = 5
+OUTBOUND_REQUEST_REFILL = timedelta(minutes=2)
+
+STATS_HISTORY_SIZE = 50
+
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 10
+
+CONF_KEEP_RAW_EVENTS = "keep_raw_events"
+DEFAULT_KEEP_RAW_EVENTS = False
+CONF_LEAN_ATTRIBUTES = "lean_attributes"
+DEFAULT_LEAN_ATTRIBUTES = False
+
+# Comma separated ICS or JSON files, relative to the configuration directory
+CONF_SEASON_FILES = "season_files"
+DEFAULT_SEASON_FILES = ""
+# Daily snapshots older than this are dropped from the schedule
+SCHEDULE_RETENTION = timedelta(days=366)
+
+CONF_TRAFFIC_LOOKAHEAD = "traffic_lookahead_minutes"
+DEFAULT_TRAFFIC_LOOKAHEAD = 30
+# Per-venue options, formatted with the venue ID
+CONF_ARRIVAL_MINUTES = "{}_arrival_minutes"
+CONF_EGRESS_MINUTES = "{}_egress_minutes"
+DEFAULT_ARRIVAL_MINUTES = 60
+DEFAULT_EGRESS_MINUTES = 60
+
+# Venue ID: (name, default arrival minutes before start, egress minutes after end)
+VENUES = {
+    "lumen_field": ("Lumen Field", 120, 90),
+    "t_mobile_park": ("T-Mobile Park", 90, 60),
+    "climate_pledge_arena": ("Climate Pledge Arena", 90, 60),
+    "husky_stadium": ("Husky Stadium", 120, 90),
+}
+# Other names the venues go by, matched case-insensitively as whole words
+VENUE_ALIASES = {
+    "lumen_field": ("CenturyLink Field", "Qwest Field", "Seahawks Stadium"),
+    "t_mobile_park": ("T Mobile Park", "TMobile Park", "Safeco Field"),
+    "climate_pledge_arena": ("KeyArena", "Key Arena", "Seattle Center Coliseum"),
+    "husky_stadium": ("Alaska Airlines Field",),
+}
+
+SERVICE_GET_EVENTS = "get_events"
+SERVICE_GET_HISTORY = "get_history"
+
+EVENT_ADDED = f"{DOMAIN}_event_added"
+EVENT_REMOVED = f"{DOMAIN}_event_removed"
+EVENT_CHANGED = f"{DOMAIN}_event_changed"
+
+# Response handed from the config flow to the first setup of the entry
+DATA_SEED = f"{DOMAIN}_seed"
+
+SEATTLE_TZ = ZoneInfo("America/Los_Angeles")
+
+# Listings only give a start time, most games wrap up within three hours
+DEFAULT_EVENT_DURATION = timedelta(hours=3)
 
 API_URL = "https://isthereaseattlehomegametoday.com/todays_events.json"
 
+FETCH_CONNECT_TIMEOUT = timedelta(seconds=10)
+FETCH_READ_TIMEOUT = timedelta(seconds=20)
+# Bounds a whole attempt, a trickling upstream never trips the read timeout
+FETCH_TOTAL_TIMEOUT = timedelta(seconds=45)
+FETCH_MAX_BYTES = 1024 * 1024
+FETCH_RETRIES = 2
+FETCH_BACKOFF_BASE = 1.0
+FETCH_BACKOFF_MAX = 30.0
+# The config flow makes a single short attempt, someone is waiting on it
+VALIDATE_FETCH_TIMEOUT = timedelta(seconds=10)
+
 ATTR_EVENTS = "events"
 ATTR_DATE = "date"
 ATTR_EVENTS_FOUND = "events_found"
@@ -1,21 +1,100 @@
 """DataUpdateCoordinator for Seattle Home Game Monitor."""
 
+import asyncio
+import hashlib
 import logging
-from datetime import datetime
-import re
-from zoneinfo import ZoneInfo
+from datetime import date, datetime, timedelta
+from time import monotonic, perf_counter
 from homeassistant.util import dt as dt_util
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.util.json import json_loads
 
 
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL, API_URL
+from .breaker import CircuitBreaker
+from .cache import LRUCache
+from .const import (
+    DOMAIN,
+    DEFAULT_SCAN_INTERVAL,
+    EVENT_ADDED,
+    EVENT_CHANGED,
+    EVENT_REMOVED,
+    API_URL,
+    BREAKER_BACKOFF_BASE,
+    BREAKER_BACKOFF_MAX,
+    BREAKER_FAILURE_THRESHOLD,
+    CONF_KEEP_RAW_EVENTS,
+    CONF_SEASON_FILES,
+    DEFAULT_KEEP_RAW_EVENTS,
+    DEFAULT_SEASON_FILES,
+    EVENT_CACHE_SIZE,
+    FAST_SCAN_INTERVAL,
+    MIN_MANUAL_REFRESH_INTERVAL,
+    OUTBOUND_REQUEST_BURST,
+    OUTBOUND_REQUEST_REFILL,
+    SCHEDULE_RETENTION,
+    SEATTLE_TZ,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .diff import diff_events
+from .fetch import FetchResult, async_fetch
+from .history import (
+    EventHistory,
+    append_history,
+    history_record,
+    read_history,
+    rewrite_history,
+)
+from .history_statistics import (
+    async_import_daily_counts,
+    async_import_missing_daily_counts,
+)
+from .index import EventIndex
+from .models import Event
+from .parser import parse_event_date, process_event, validate_payload
+from .ratelimit import TokenBucket
+from .schedule import Schedule
+from .scheduler import PublishScheduler
+from .season import parse_ics, parse_season_json
+from .timeline import EventTimeline
+from .stats import (
+    OUTCOME_CIRCUIT_OPEN,
+    OUTCOME_NOT_MODIFIED,
+    OUTCOME_RATE_LIMITED,
+    OUTCOME_UNCHANGED,
+    OUTCOME_UPDATED,
+    RefreshStats,
+    RefreshTiming,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+_SORT_SENTINEL = datetime.max.replace(tzinfo=SEATTLE_TZ)
+
+
+def _load_season_files(paths: list[str]) -> dict[date, list[Event]]:
+    """Read and parse season files, skipping any that cannot be used."""
+    days: dict[date, list[Event]] = {}
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as file:
+                text = file.read()
+            if path.lower().endswith(".ics"):
+                parsed = parse_ics(text)
+            else:
+                parsed = parse_season_json(json_loads(text))
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Ignoring season file %s: %s", path, err)
+            continue
+        for day, events in parsed.items():
+            days.setdefault(day, []).extend(events)
+    return days
+
 
 class IsThereASeattleHomeGameTodayCoordinator(DataUpdateCoordinator):
     """Seattle Home Game Monitor coordinator."""
@@ -29,133 +108,416 @@ class IsThereASeattleHomeGameTodayCoordinator(DataUpdateCoordinator):
             update_interval=DEFAULT_SCAN_INTERVAL,
         )
         self.entry = entry
+        self.last_poll: datetime | None = None
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._content_hash: str | None = None
+        self._scheduler = PublishScheduler()
+        # Restored or seeded data says nothing about when it was published,
+        # only changes between two polls of this run are publish times
+        self._polled = False
+        self.event_cache = LRUCache(EVENT_CACHE_SIZE)
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+        self._rate_limit = TokenBucket(
+            OUTBOUND_REQUEST_BURST, OUTBOUND_REQUEST_REFILL.total_seconds()
+        )
+        self._fetch_task: asyncio.Task | None = None
+        self.stats = RefreshStats()
+        self._breaker = CircuitBreaker(
+            BREAKER_FAILURE_THRESHOLD,
+            BREAKER_BACKOFF_BASE.total_seconds(),
+            BREAKER_BACKOFF_MAX.total_seconds(),
+        )
+        self.stale_since: datetime | None = None
+        self.timeline = EventTimeline(self)
+        self._last_fetch: float | None = None
+        self.schedule = Schedule({})
+        self._snapshot_days: dict[date, list[Event]] = {}
+        self._season_days: dict[date, list[Event]] = {}
+        self._days_store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.days"
+        )
+        self.history = EventHistory()
+        self._history_path = hass.config.path(
+            STORAGE_DIR, f"{DOMAIN}.{entry.entry_id}.history"
+        )
+        # Appends run as background tasks in executor threads, so without the
+        # lock two of them, or an append and a rewrite, could interleave
+        self._history_lock = asyncio.Lock()
 
-    def _extract_time_from_description(self, description: str) -> str | None:
-        """Extract time from description text."""
-        # Look for patterns like "3:04 PM", "10:30 AM", "7:00PM" etc.
-        time_patterns = [
-            r"starts\s+at\s+(\d{1,2}:\d{2}\s*[APap][Mm])",  # starts at 3:04 PM
-            r"at\s+(\d{1,2}:\d{2}\s*[APap][Mm])",  # at 3:04 PM
-            r"\b(\d{1,2}:\d{2}\s*[APap][Mm])\b",  # 3:04 PM or 3:04PM
-            r"\b(\d{1,2}:\d{2}\s*[ap]\.m\.)\b",  # 3:04 p.m.
-        ]
+    async def async_manual_refresh(self) -> None:
+        """Refresh on user request, serving cached data if polled very recently."""
+        if (
+            self._fetch_task is None
+            and self._last_fetch is not None
+            and monotonic() - self._last_fetch
+            < MIN_MANUAL_REFRESH_INTERVAL.total_seconds()
+        ):
+            _LOGGER.debug("Ignoring manual refresh, data was fetched moments ago")
+            return
+        await self.async_refresh()
 
-        for pattern in time_patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
-            if match:
-                # Normalize the time format
-                time_str = match.group(1)
-                # Remove extra spaces and standardize AM/PM
-                time_str = re.sub(r"\s+", " ", time_str).strip()
-                time_str = re.sub(r"([ap])\.m\.", r"\1m", time_str, flags=re.IGNORECASE)
-                return time_str.upper()
-
-        return None
-
-    def _parse_time_to_datetime(
-        self, time_str: str | None, date_str: str
-    ) -> datetime | None:
-        """Convert time string to datetime object."""
-        if not time_str:
-            return None
+    async def async_restore_snapshot(self) -> bool:
+        """Load the last good data from disk, returning true if there was any."""
+        stored = await self._store.async_load()
+        if not stored:
+            return False
 
         try:
-            # Parse the time
-            time_formats = [
-                "%I:%M %p",  # 3:04 PM
-                "%I:%M%p",  # 3:04PM
-            ]
-
-            for fmt in time_formats:
-                try:
-                    parsed_time = datetime.strptime(time_str, fmt).time()
-                    event_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                    seattle_tz = ZoneInfo("America/Los_Angeles")
-                    without_tz = datetime.combine(event_date, parsed_time)
-                    return without_tz.replace(tzinfo=seattle_tz)
-                except ValueError:
-                    continue
-
-        except Exception as e:
-            _LOGGER.debug("Could not parse time %s: %s", time_str, e)
-
-        return None
-
-    def _process_event(self, event: dict, date_str: str) -> dict:
-        """Process a single event to extract all information."""
-        description = event.get("description", "")
-        event_time = event.get("local_time")
-
-        if not event_time:
-            event_time = self._extract_time_from_description(description)
-
-        # Parse venue from description
-        venue = None
-        venue_patterns = [
-            r"at\s+([^.]+?)(?:\.|$)",  # "at Lumen Field."
-            r"is\s+at\s+([^.]+?)(?:\.|$)",  # "is at Climate Pledge Arena."
+            events = [Event.from_dict(event) for event in stored["events"]]
+            date_str = stored["date"]
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring unreadable snapshot: %s", err)
+            return False
+
+        self._etag = stored.get("etag")
+        self._last_modified = stored.get("last_modified")
+        self._content_hash = stored.get("content_hash")
+        if last_poll := stored.get("last_poll"):
+            self.last_poll = dt_util.parse_datetime(last_poll)
+        self._scheduler.restore(stored.get("scheduler", {}))
+
+        self.data = self._build_data(date_str, events)
+        self._record_day(date_str, self.data["events"])
+        return True
+
+    async def async_load_schedule(self) -> None:
+        """Load the accumulated daily snapshots and the configured season files."""
+        stored = await self._days_store.async_load() or {}
+        try:
+            self._snapshot_days = {
+                date.fromisoformat(day): [Event.from_dict(event) for event in events]
+                for day, events in stored.get("days", {}).items()
+            }
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring unreadable daily snapshots: %s", err)
+            self._snapshot_days = {}
+
+        option = self.entry.options.get(CONF_SEASON_FILES, DEFAULT_SEASON_FILES)
+        paths = [
+            self.hass.config.path(path.strip())
+            for path in option.split(",")
+            if path.strip()
         ]
+        if paths:
+            self._season_days = await self.hass.async_add_executor_job(
+                _load_season_files, paths
+            )
+        self._rebuild_schedule()
 
-        for pattern in venue_patterns:
-            match = re.search(pattern, description)
-            if match:
-                venue = match.group(1).strip()
-                # Remove time from venue if it got included
-                venue = re.sub(
-                    r"\.\s*(?:It\s+)?(?:starts\s+at|The\s+game\s+is\s+at)\s+\d{1,2}:\d{2}\s*[APap][Mm].*",
-                    "",
-                    venue,
-                ).strip()
-                break
-
-        name = event.get("name", event.get("title", ""))
-        if not name:
-            name = description[:252] + "..." if len(description) > 255 else description
+    async def async_load_history(self) -> None:
+        """Replay the history log and add any snapshot days missing from it."""
+        records = await self.hass.async_add_executor_job(
+            read_history, self._history_path
+        )
+        for record in records:
+            try:
+                self.history.apply(record)
+            except (KeyError, TypeError, ValueError) as err:
+                _LOGGER.warning("Skipping unreadable history record: %s", err)
 
+        # Days recorded several times only need their latest record
+        if len(records) > 2 * len(self.history):
+            async with self._history_lock:
+                await self.hass.async_add_executor_job(
+                    rewrite_history, self._history_path, self.history.records()
+                )
+
+        missing = [
+            history_record(day, events)
+            for day, events in sorted(self._snapshot_days.items())
+            if day not in self.history
+        ]
+        for record in missing:
+            self.history.apply(record)
+        if missing:
+            await self._async_append_history(missing)
+
+        # Statistics are backfilled on the first start, after that only new
+        # and changed days are imported. This finishes before the first
+        # refresh, whose import carries on from the days imported here
+        await async_import_missing_daily_counts(
+            self.hass,
+            self.history,
+            date.fromisoformat(missing[0]["date"]) if missing else None,
+        )
+
+    def _rebuild_schedule(self) -> None:
+        """Merge season files with daily snapshots, which take precedence."""
+        self.schedule = Schedule({**self._season_days, **self._snapshot_days})
+
+    def _record_day(self, date_str: str, events: list[Event]) -> None:
+        """Add a day's events to the schedule and persist them."""
+        day = parse_event_date(date_str)
+        if day is None or self._snapshot_days.get(day) == events:
+            return
+        self._snapshot_days[day] = list(events)
+        cutoff = day - SCHEDULE_RETENTION
+        for old_day in [old for old in self._snapshot_days if old < cutoff]:
+            del self._snapshot_days[old_day]
+        self._rebuild_schedule()
+        self._days_store.async_delay_save(self._days_snapshot, SNAPSHOT_SAVE_DELAY)
+
+        record = history_record(day, events)
+        if self.history.apply(record):
+            self.entry.async_create_background_task(
+                self.hass,
+                self._async_append_history([record]),
+                f"{DOMAIN} history append",
+            )
+            # Cumulative sums after the day change too, earlier days do not
+            async_import_daily_counts(self.hass, self.history, day)
+
+    async def _async_append_history(self, records: list[dict]) -> None:
+        """Append records to the history log, one write at a time and in order."""
+        async with self._history_lock:
+            await self.hass.async_add_executor_job(
+                append_history, self._history_path, records
+            )
+
+    def _days_snapshot(self) -> dict:
+        """Return the accumulated daily snapshots for persisting."""
+        return {
+            "days": {
+                day.isoformat(): [event.as_dict() for event in events]
+                for day, events in self._snapshot_days.items()
+            }
+        }
+
+    def _snapshot(self) -> dict:
+        """Return the current data and validators for persisting."""
         return {
-            "name": name,
-            "description": description,
-            "time": event_time,
-            "venue": venue,
-            "datetime": (
-                self._parse_time_to_datetime(event_time, date_str)
-                if event_time
-                else None
-            ),
+            "date": self.data.get("date"),
+            "events": [event.as_dict() for event in self.data.get("events", [])],
+            "etag": self._etag,
+            "last_modified": self._last_modified,
+            "content_hash": self._content_hash,
+            "last_poll": self.last_poll.isoformat() if self.last_poll else None,
+            "scheduler": self._scheduler.as_dict(),
+        }
+
+    @property
+    def outdated(self) -> bool:
+        """Return true if the data is for a day that has passed in Seattle."""
+        if not self.data:
+            return False
+        data_date = parse_event_date(self.data.get("date"))
+        return data_date is not None and data_date < dt_util.now(SEATTLE_TZ).date()
+
+    @property
+    def publish_window(self) -> tuple[int, int] | None:
+        """Return the learned publish window in minutes after midnight."""
+        return self._scheduler.publish_window
+
+    def _schedule_next_poll(self, data_date: str | None) -> None:
+        """Adapt the polling interval to the learned publish window."""
+        now = dt_util.now(SEATTLE_TZ)
+        self.update_interval = self._scheduler.next_interval(now, data_date)
+        _LOGGER.debug("Next poll of %s in %s", API_URL, self.update_interval)
+
+    def _conditional_headers(self) -> dict[str, str]:
+        """Return validators from the last good response as request headers."""
+        headers = {}
+        if self.data is None:
+            return headers
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+        return headers
+
+    def _process_event(self, event: dict, event_date: date | None) -> Event:
+        """Process a single event, reusing the result for recurring events."""
+        key = (
+            event.get("description", ""),
+            event.get("local_time"),
+            event_date,
+            event.get("name", event.get("title", "")),
+        )
+        processed = self.event_cache.get(key)
+        if processed is None:
+            processed = process_event(event, event_date)
+            self.event_cache.put(key, processed)
+        return processed
+
+    def _build_data(self, date_str: str, events: list[Event]) -> dict:
+        """Build the coordinator data from processed events."""
+        # Sort events by time if available
+        events.sort(key=lambda e: (e.datetime is None, e.datetime or _SORT_SENTINEL))
+
+        # Identical events on the same day still need distinct keys
+        events_by_key = {}
+        for event in events:
+            key = event.key
+            suffix = 2
+            while key in events_by_key:
+                key = f"{event.key}_{suffix}"
+                suffix += 1
+            events_by_key[key] = event
+
+        return {
+            "date": date_str,
+            "events": events,
+            "events_by_key": events_by_key,
+            "events_found": len(events) > 0,
+            "event_count": len(events),
+            "index": EventIndex(events),
         }
 
     async def _async_update_data(self):
+        """Fetch data from API, sharing a fetch that is already in flight."""
+        if self._fetch_task is None:
+            # A background task, so that waiting for startup to settle does
+            # not wait on the network
+            self._fetch_task = self.entry.async_create_background_task(
+                self.hass, self._async_fetch_data(), f"{DOMAIN} fetch"
+            )
+            self._fetch_task.add_done_callback(self._clear_fetch_task)
+        return await asyncio.shield(self._fetch_task)
+
+    def _clear_fetch_task(self, _task: asyncio.Task) -> None:
+        """Allow the next refresh to start a new fetch."""
+        self._fetch_task = None
+
+    async def _async_fetch_data(self):
+        """Fetch data from API, recording how long each stage took."""
+        timing = RefreshTiming(started=dt_util.utcnow())
+        try:
+            return await self._async_fetch_and_process(timing)
+        finally:
+            self.stats.record(timing)
+
+    @callback
+    def async_seed(self, response: FetchResult, payload: dict) -> None:
+        """Use a response already fetched and validated by the config flow."""
+        self.last_poll = dt_util.now()
+        timing = RefreshTiming(started=dt_util.utcnow())
+        self.data = self._process_response(response, timing, payload)
+        self.stats.record(timing)
+
+    def _process_response(
+        self, response: FetchResult, timing: RefreshTiming, payload: dict | None = None
+    ):
+        """Turn a successful response into coordinator data."""
+        # Unchanged responses hand back the previous data object, so only
+        # entities that render the poll time itself write new state
+        if response.status == 304 and self.data is not None:
+            _LOGGER.debug("%s not modified since last poll", API_URL)
+            timing.outcome = OUTCOME_NOT_MODIFIED
+            self._schedule_next_poll(self.data.get("date"))
+            return self.data
+
+        body = response.body
+        timing.payload_bytes = len(body)
+        self._etag = response.headers.get("ETag")
+        self._last_modified = response.headers.get("Last-Modified")
+
+        content_hash = hashlib.sha256(body).hexdigest()
+        if content_hash == self._content_hash and self.data is not None:
+            _LOGGER.debug("%s returned an identical body", API_URL)
+            timing.outcome = OUTCOME_UNCHANGED
+            self._schedule_next_poll(self.data.get("date"))
+            return self.data
+
+        if payload is None:
+            start = perf_counter()
+            payload = validate_payload(json_loads(body))
+            timing.decode_ms = (perf_counter() - start) * 1000
+
+        # Process events
+        start = perf_counter()
+        date_str = payload["date"]
+        raw_events = payload["events"]
+        event_date = parse_event_date(date_str)
+        processed_events = [
+            self._process_event(event, event_date) for event in raw_events
+        ]
+
+        if self._polled:
+            self._scheduler.record_change(dt_util.now(SEATTLE_TZ))
+        self._content_hash = content_hash
+        self._schedule_next_poll(date_str)
+
+        result = self._build_data(date_str, processed_events)
+        if self.entry.options.get(CONF_KEEP_RAW_EVENTS, DEFAULT_KEEP_RAW_EVENTS):
+            result["raw_events"] = raw_events
+        timing.process_ms = (perf_counter() - start) * 1000
+        timing.outcome = OUTCOME_UPDATED
+
+        if self.data is not None:
+            self._fire_event_diff(self.data, result)
+        self._record_day(date_str, result["events"])
+
+        # Written once the data is in place so the next start can use it
+        self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+
+        return result
+
+    def _fire_event_diff(self, old: dict, new: dict) -> None:
+        """Fire one bus event per added, removed or changed event."""
+        diff = diff_events(old.get("events_by_key", {}), new["events_by_key"])
+        date_str = new["date"]
+        for event in diff.added:
+            self.hass.bus.async_fire(
+                EVENT_ADDED, {"date": date_str, "event": event.as_json_dict()}
+            )
+        for event in diff.removed:
+            self.hass.bus.async_fire(
+                EVENT_REMOVED, {"date": date_str, "event": event.as_json_dict()}
+            )
+        for previous, event in diff.changed:
+            self.hass.bus.async_fire(
+                EVENT_CHANGED,
+                {
+                    "date": date_str,
+                    "event": event.as_json_dict(),
+                    "previous": previous.as_json_dict(),
+                },
+            )
+
+    def _serve_stale(self, reason: str):
+        """Keep serving the last good data while retrying in the background."""
+        if self.stale_since is None:
+            self.stale_since = dt_util.now()
+            _LOGGER.warning("Serving last good data from %s: %s", API_URL, reason)
+
+        retry_in = timedelta(seconds=self._breaker.retry_in)
+        self.update_interval = max(retry_in, FAST_SCAN_INTERVAL)
+        return self.data
+
+    async def _async_fetch_and_process(self, timing: RefreshTiming):
         """Fetch data from API."""
+        if not self._breaker.allow_request():
+            timing.outcome = OUTCOME_CIRCUIT_OPEN
+            if self.data is not None:
+                return self._serve_stale("circuit breaker is open")
+            raise UpdateFailed(f"Circuit breaker is open for {API_URL}")
+
+        if not self._rate_limit.try_acquire():
+            if self.data is not None:
+                _LOGGER.debug("Outbound rate limit reached, serving cached data")
+                timing.outcome = OUTCOME_RATE_LIMITED
+                return self.data
+            raise UpdateFailed(f"Rate limit reached for {API_URL}")
+
         try:
+            start = perf_counter()
+            self._last_fetch = monotonic()
             session = async_get_clientsession(self.hass)
-            response = await session.get(API_URL)
-
-            if response.status != 200:
-                raise UpdateFailed(
-                    f"Error fetching {API_URL}: {response.status}"
-                )
+            response = await async_fetch(
+                session, API_URL, self._conditional_headers()
+            )
+            self.last_poll = dt_util.now()
+            self._breaker.record_success()
+            self.stale_since = None
 
-            data = await response.json()
-
-            # Process events
-            date_str = data.get("date", "")
-            raw_events = data.get("events", [])
-            processed_events = [
-                self._process_event(event, date_str) for event in raw_events
-            ]
-
-            # Sort events by time if available
-            _SORT_SENTINEL = datetime.max.replace(tzinfo=ZoneInfo("America/Los_Angeles"))
-            processed_events.sort(key=lambda e: (e["datetime"] is None, e["datetime"] or _SORT_SENTINEL))
-
-            return {
-                "date": date_str,
-                "events": processed_events,
-                "raw_events": raw_events,
-                "events_found": len(processed_events) > 0,
-                "last_poll": dt_util.now(),
-                "event_count": len(processed_events),
-            }
+            timing.fetch_ms = (perf_counter() - start) * 1000
+            result = self._process_response(response, timing)
+            self._polled = True
+            return result
 
         except Exception as err:
-            raise UpdateFailed(f"Error communicating with API: {err}")
+            self._breaker.record_failure()
+            if self.data is None:
+                raise UpdateFailed(f"Error communicating with API: {err}") from err
+            return self._serve_stale(str(err))
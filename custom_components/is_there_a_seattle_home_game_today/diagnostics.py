@@ -0,0 +1,45 @@
+"""Diagnostics support for Is There a Seattle Home Game Today?"""
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data or {}
+    cache = coordinator.event_cache
+    schedule = coordinator.schedule
+
+    return {
+        "options": dict(entry.options),
+        "data": {
+            "date": data.get("date"),
+            "event_count": data.get("event_count"),
+        },
+        "last_poll": coordinator.last_poll.isoformat() if coordinator.last_poll else None,
+        "update_interval": str(coordinator.update_interval),
+        "last_update_success": coordinator.last_update_success,
+        "publish_window": coordinator.publish_window,
+        "event_cache": {
+            "size": len(cache),
+            "maxsize": cache.maxsize,
+            "hits": cache.hits,
+            "misses": cache.misses,
+            "evictions": cache.evictions,
+            "hit_ratio": cache.hit_ratio,
+        },
+        "refresh": coordinator.stats.as_dict(),
+        "schedule": {
+            "days": len(schedule),
+            "first_day": schedule.first_day and schedule.first_day.isoformat(),
+            "last_day": schedule.last_day and schedule.last_day.isoformat(),
+        },
+        "history_days": len(coordinator.history),
+    }
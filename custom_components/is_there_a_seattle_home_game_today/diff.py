@@ -0,0 +1,33 @@
+"""Keyed diffs between coordinator snapshots."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+from .models import Event
+
+
+@dataclass(slots=True)
+class EventsDiff:
+    """Events added, removed and changed between two snapshots."""
+
+    added: list[Event] = field(default_factory=list)
+    removed: list[Event] = field(default_factory=list)
+    # (previous, current) pairs sharing a key
+    changed: list[tuple[Event, Event]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Return true if anything differs."""
+        return bool(self.added or self.removed or self.changed)
+
+
+def diff_events(old: Mapping[str, Event], new: Mapping[str, Event]) -> EventsDiff:
+    """Compare two snapshots keyed by event identity."""
+    diff = EventsDiff()
+    for key, event in new.items():
+        previous = old.get(key)
+        if previous is None:
+            diff.added.append(event)
+        elif previous != event:
+            diff.changed.append((previous, event))
+    diff.removed.extend(event for key, event in old.items() if key not in new)
+    return diff
@@ -0,0 +1,57 @@
+"""Base entity for Is There a Seattle Home Game Today?"""
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+
+
+class SeattleHomeGameEntity(CoordinatorEntity):
+    """Coordinator entity that only writes state when its output changes."""
+
+    def __init__(self, coordinator):
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._last_rendered = None
+
+    @property
+    def device_info(self):
+        return {
+            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
+            "name": "Seattle Home Game Monitor",
+            "manufacturer": "isthereaseattlehomegametoday.com",
+            "entry_type": "service",
+        }
+
+    def _rendered_state(self) -> Any:
+        """Return the coordinator fields this entity renders."""
+        return self.coordinator.data
+
+    async def async_added_to_hass(self) -> None:
+        """Remember what was rendered when the entity was added."""
+        await super().async_added_to_hass()
+        self._last_rendered = (self.available, self._rendered_state())
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if something this entity renders has changed."""
+        rendered = (self.available, self._rendered_state())
+        if rendered == self._last_rendered:
+            return
+        self._last_rendered = rendered
+        super()._handle_coordinator_update()
+
+
+class SeattleHomeGameTimelineEntity(SeattleHomeGameEntity):
+    """Entity that also updates when an event starts or ends."""
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to event start and end callbacks."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.timeline.async_add_listener(
+                self._handle_coordinator_update
+            )
+        )
@@ -0,0 +1,113 @@
+"""HTTP fetching for Seattle Home Game Monitor."""
+
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import timedelta
+import logging
+import random
+
+import aiohttp
+
+from .const import (
+    FETCH_BACKOFF_BASE,
+    FETCH_BACKOFF_MAX,
+    FETCH_CONNECT_TIMEOUT,
+    FETCH_MAX_BYTES,
+    FETCH_READ_TIMEOUT,
+    FETCH_RETRIES,
+    FETCH_TOTAL_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 64 * 1024
+_TIMEOUT = aiohttp.ClientTimeout(
+    total=FETCH_TOTAL_TIMEOUT.total_seconds(),
+    connect=FETCH_CONNECT_TIMEOUT.total_seconds(),
+    sock_read=FETCH_READ_TIMEOUT.total_seconds(),
+)
+
+
+class FetchError(Exception):
+    """Raised when the API cannot be fetched."""
+
+
+class RetryableFetchError(FetchError):
+    """Raised for failures that may succeed on another attempt."""
+
+
+@dataclass(slots=True)
+class FetchResult:
+    """Status, headers and body of a completed request."""
+
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+
+
+async def async_fetch(
+    session: aiohttp.ClientSession,
+    url: str,
+    headers: Mapping[str, str] | None = None,
+    retries: int = FETCH_RETRIES,
+    timeout: timedelta | None = None,
+) -> FetchResult:
+    """Fetch url, retrying transient failures with jittered exponential backoff.
+
+    Returns a result with status 200 or, for conditional requests, 304. A
+    timeout replaces the default timeouts of each attempt.
+    """
+    request_headers = {"Accept-Encoding": "gzip", **(headers or {})}
+    client_timeout = (
+        _TIMEOUT
+        if timeout is None
+        else aiohttp.ClientTimeout(total=timeout.total_seconds())
+    )
+
+    for attempt in range(retries + 1):
+        try:
+            return await _async_fetch_once(
+                session, url, request_headers, client_timeout
+            )
+        except RetryableFetchError as err:
+            if attempt == retries:
+                raise
+            delay = random.uniform(
+                0, min(FETCH_BACKOFF_MAX, FETCH_BACKOFF_BASE * 2**attempt)
+            )
+            _LOGGER.debug("Fetching %s failed (%s), retrying in %.1fs", url, err, delay)
+            await asyncio.sleep(delay)
+
+    raise FetchError(f"Error fetching {url}")
+
+
+async def _async_fetch_once(
+    session: aiohttp.ClientSession,
+    url: str,
+    headers: Mapping[str, str],
+    timeout: aiohttp.ClientTimeout,
+) -> FetchResult:
+    """Make a single request, releasing the connection when done."""
+    try:
+        async with session.get(url, headers=headers, timeout=timeout) as response:
+            if response.status == 304:
+                return FetchResult(304, response.headers, b"")
+            if response.status == 429 or response.status >= 500:
+                raise RetryableFetchError(f"Error fetching {url}: {response.status}")
+            if response.status != 200:
+                raise FetchError(f"Error fetching {url}: {response.status}")
+            if (response.content_length or 0) > FETCH_MAX_BYTES:
+                raise FetchError(f"Response from {url} exceeds {FETCH_MAX_BYTES} bytes")
+
+            # Bound the decompressed size, not just the advertised length
+            body = bytearray()
+            async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                body += chunk
+                if len(body) > FETCH_MAX_BYTES:
+                    raise FetchError(
+                        f"Response from {url} exceeds {FETCH_MAX_BYTES} bytes"
+                    )
+            return FetchResult(200, response.headers, bytes(body))
+    except (aiohttp.ClientError, TimeoutError) as err:
+        raise RetryableFetchError(f"Error fetching {url}: {err!r}") from err
@@ -0,0 +1,186 @@
+"""Compact history of past days for Is There a Seattle Home Game Today?"""
+
+from collections import Counter, defaultdict
+import contextlib
+from collections.abc import Iterable
+from datetime import date
+import json
+import logging
+import os
+from typing import Any
+
+from .models import Event
+
+_LOGGER = logging.getLogger(__name__)
+
+UNKNOWN_VENUE = "unknown"
+WEEKDAYS = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+
+
+def history_record(day: date, events: Iterable[Event]) -> dict[str, Any]:
+    """Return the compact record of a day: its date and [name, time, venue]."""
+    return {
+        "date": day.isoformat(),
+        "events": [
+            [event.name, event.time, event.venue_id or event.venue or UNKNOWN_VENUE]
+            for event in events
+        ],
+    }
+
+
+def read_history(path: str) -> list[dict[str, Any]]:
+    """Read all records of a history log, skipping unreadable lines."""
+    records = []
+    try:
+        with open(path, encoding="utf-8") as file:
+            for line_number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # Most likely a write cut short by a crash
+                    _LOGGER.warning(
+                        "Skipping unreadable line %s of %s", line_number, path
+                    )
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def append_history(path: str, records: list[dict[str, Any]]) -> None:
+    """Append records to a history log, one JSON object per line."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "ab+") as file:
+        # Start on a new line if the last write was cut short
+        if file.seek(0, os.SEEK_END):
+            file.seek(-1, os.SEEK_END)
+            if file.read(1) != b"\n":
+                file.write(b"\n")
+        file.writelines(
+            (json.dumps(record, separators=(",", ":")) + "\n").encode()
+            for record in records
+        )
+
+
+def rewrite_history(path: str, records: list[dict[str, Any]]) -> None:
+    """Replace a history log with the given records."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        file.writelines(
+            json.dumps(record, separators=(",", ":")) + "\n" for record in records
+        )
+    os.replace(temp_path, path)
+
+
+def remove_history(path: str) -> None:
+    """Delete a history log, if there is one."""
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+
+
+def _add(counter: Counter, key: str, amount: int) -> None:
+    """Add to a counter, dropping keys that reach zero."""
+    counter[key] += amount
+    if not counter[key]:
+        del counter[key]
+
+
+class EventHistory:
+    """Counters per venue, weekday and month, updated as records arrive."""
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        # Latest events of each day, later records for a day replace earlier ones
+        self._days: dict[date, list[list]] = {}
+        self.by_venue: Counter[str] = Counter()
+        self.by_weekday: Counter[str] = Counter()
+        self.by_month: Counter[str] = Counter()
+        self.by_venue_month: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self.first_day: date | None = None
+        self.last_day: date | None = None
+
+    def __len__(self) -> int:
+        """Return the number of days recorded."""
+        return len(self._days)
+
+    def __contains__(self, day: date) -> bool:
+        """Return true if a day has been recorded."""
+        return day in self._days
+
+    def records(self) -> list[dict[str, Any]]:
+        """Return the latest record of every day, oldest first."""
+        return [
+            {"date": day.isoformat(), "events": self._days[day]}
+            for day in sorted(self._days)
+        ]
+
+    def days(self) -> list[tuple[date, list[list]]]:
+        """Return the latest events of every day, oldest first."""
+        return sorted(self._days.items())
+
+    def apply(self, record: dict[str, Any]) -> bool:
+        """Count a record, returning false if it repeats what is known."""
+        day = date.fromisoformat(record["date"])
+        events = [list(event) for event in record["events"]]
+        if any(len(event) != 3 for event in events):
+            raise ValueError(f"Malformed events for {day}")
+        previous = self._days.get(day)
+        if previous == events:
+            return False
+        if previous is not None:
+            self._count(day, previous, -1)
+        self._days[day] = events
+        self._count(day, events, 1)
+        if self.first_day is None or day < self.first_day:
+            self.first_day = day
+        if self.last_day is None or day > self.last_day:
+            self.last_day = day
+        return True
+
+    def _count(self, day: date, events: list[list], amount: int) -> None:
+        """Add or remove a day's events from the counters."""
+        weekday = WEEKDAYS[day.weekday()]
+        month = f"{day:%Y-%m}"
+        for _name, _time, venue in events:
+            _add(self.by_venue, venue, amount)
+            _add(self.by_weekday, weekday, amount)
+            _add(self.by_month, month, amount)
+            _add(self.by_venue_month[venue], month, amount)
+            if not self.by_venue_month[venue]:
+                del self.by_venue_month[venue]
+
+    def as_dict(self, venue: str | None = None) -> dict[str, Any]:
+        """Return the counters, optionally only the monthly ones of a venue."""
+        result: dict[str, Any] = {
+            "days": len(self._days),
+            "first_day": self.first_day.isoformat() if self.first_day else None,
+            "last_day": self.last_day.isoformat() if self.last_day else None,
+        }
+        if venue is not None:
+            by_month = self.by_venue_month.get(venue, {})
+            result["venue"] = venue
+            result["events"] = self.by_venue.get(venue, 0)
+            result["by_month"] = dict(sorted(by_month.items()))
+            return result
+        result["events"] = sum(self.by_venue.values())
+        result["by_venue"] = dict(self.by_venue.most_common())
+        result["by_weekday"] = {
+            weekday: self.by_weekday[weekday]
+            for weekday in WEEKDAYS
+            if weekday in self.by_weekday
+        }
+        result["by_month"] = dict(sorted(self.by_month.items()))
+        result["by_venue_month"] = {
+            venue: dict(sorted(months.items()))
+            for venue, months in self.by_venue_month.items()
+        }
+        return result
@@ -0,0 +1,98 @@
+"""Long-term statistics of daily event counts."""
+
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SEATTLE_TZ, VENUES
+from .history import EventHistory
+
+
+def statistic_id(venue_id: str | None = None) -> str:
+    """Return the ID of the overall or a venue's daily event count statistic."""
+    return f"{DOMAIN}:{venue_id}_events" if venue_id else f"{DOMAIN}:events"
+
+
+@callback
+def async_import_daily_counts(
+    hass: HomeAssistant, history: EventHistory, since: date | None = None
+) -> None:
+    """Import the event counts of the days from since on, one batch per statistic.
+
+    Sums carry on from the days before since, which must have been imported
+    already, so a change to one day only rewrites that day and the ones after.
+    """
+    if not history or "recorder" not in hass.config.components:
+        return
+
+    batches: dict[str | None, list[StatisticData]] = {None: []}
+    batches.update((venue_id, []) for venue_id in VENUES)
+    sums = dict.fromkeys(batches, 0)
+    for day, events in history.days():
+        start = datetime.combine(day, time.min, SEATTLE_TZ)
+        venue_counts = Counter(venue for _name, _time, venue in events)
+        for venue_id, batch in batches.items():
+            count = len(events) if venue_id is None else venue_counts[venue_id]
+            sums[venue_id] += count
+            if since is None or day >= since:
+                batch.append(
+                    StatisticData(start=start, state=count, sum=sums[venue_id])
+                )
+    if not batches[None]:
+        return
+
+    for venue_id, batch in batches.items():
+        name = (
+            f"{VENUES[venue_id][0]} events" if venue_id else "Seattle home game events"
+        )
+        async_add_external_statistics(
+            hass,
+            StatisticMetaData(
+                mean_type=StatisticMeanType.NONE,
+                has_sum=True,
+                name=name,
+                source=DOMAIN,
+                statistic_id=statistic_id(venue_id),
+                unit_of_measurement=None,
+            ),
+            batch,
+        )
+
+
+async def async_import_missing_daily_counts(
+    hass: HomeAssistant, history: EventHistory, changed: date | None = None
+) -> None:
+    """Import the days after the last imported one, and any changed before it.
+
+    Everything is imported only when there are no statistics yet. The venue
+    statistics are always imported with the overall one, so its last row
+    stands for all of them.
+    """
+    if not history or "recorder" not in hass.config.components:
+        return
+
+    last = await get_instance(hass).async_add_executor_job(
+        get_last_statistics, hass, 1, statistic_id(), False, {"sum"}
+    )
+    if rows := last.get(statistic_id()):
+        last_day = dt_util.utc_from_timestamp(rows[0]["start"])
+        since = last_day.astimezone(SEATTLE_TZ).date() + timedelta(days=1)
+        if changed is not None:
+            since = min(since, changed)
+        if history.last_day is None or since > history.last_day:
+            return
+    else:
+        since = None
+    async_import_daily_counts(hass, history, since)
@@ -0,0 +1,85 @@
+"""Precomputed lookups over a day's events."""
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import datetime
+from types import MappingProxyType
+
+from .const import DEFAULT_EVENT_DURATION
+from .models import Event
+
+
+class EventIndex:
+    """Immutable indexes over one day's events, built once per refresh."""
+
+    __slots__ = (
+        "by_venue",
+        "by_venue_time",
+        "no_venue",
+        "by_venue_id",
+        "timed",
+        "_starts",
+    )
+
+    def __init__(self, events: list[Event]) -> None:
+        """Index events, which must already be sorted by start time."""
+        by_venue = defaultdict(list)
+        by_venue_id = defaultdict(list)
+        no_venue = []
+        for event in events:
+            if event.venue:
+                by_venue[event.venue].append(event)
+            else:
+                no_venue.append(event)
+            if event.venue_id:
+                by_venue_id[event.venue_id].append(event)
+
+        by_venue_time = {}
+        for venue, venue_events in by_venue.items():
+            time_groups = defaultdict(list)
+            for event in venue_events:
+                time_groups[event.time or "No time"].append(event)
+            by_venue_time[venue] = MappingProxyType(
+                {time: tuple(group) for time, group in time_groups.items()}
+            )
+
+        self.by_venue = MappingProxyType(
+            {venue: tuple(group) for venue, group in by_venue.items()}
+        )
+        self.by_venue_time = MappingProxyType(by_venue_time)
+        self.by_venue_id = MappingProxyType(
+            {venue_id: tuple(group) for venue_id, group in by_venue_id.items()}
+        )
+        self.no_venue = tuple(no_venue)
+        self.timed = tuple(event for event in events if event.datetime)
+        self._starts = [event.datetime for event in self.timed]
+
+    def count_for_venue_id(self, venue_id: str) -> int:
+        """Return the number of events at a known venue."""
+        return len(self.by_venue_id.get(venue_id, ()))
+
+    def next_event(self, now: datetime, venue_id: str | None = None) -> Event | None:
+        """Return the first event starting after now, optionally at one venue."""
+        if venue_id is not None:
+            return next(
+                (
+                    event
+                    for event in self.by_venue_id.get(venue_id, ())
+                    if event.datetime and event.datetime > now
+                ),
+                None,
+            )
+        index = bisect_right(self._starts, now)
+        return self.timed[index] if index < len(self.timed) else None
+
+    def in_progress(self, now: datetime) -> tuple[Event, ...]:
+        """Return the events that started within one event duration of now."""
+        start = bisect_right(self._starts, now - DEFAULT_EVENT_DURATION)
+        end = bisect_right(self._starts, now)
+        return self.timed[start:end]
+
+    def starting_between(self, start: datetime, end: datetime) -> tuple[Event, ...]:
+        """Return the events starting in [start, end)."""
+        return self.timed[
+            bisect_left(self._starts, start) : bisect_left(self._starts, end)
+        ]
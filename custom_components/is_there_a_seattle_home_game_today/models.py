@@ -0,0 +1,62 @@
+"""Data models for Is There a Seattle Home Game Today?"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from .venues import venue_id_for
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """A processed event."""
+
+    name: str
+    description: str
+    time: str | None
+    venue: str | None
+    datetime: datetime | None
+    # Stable identity across refreshes, derived from the name and description
+    key: str
+    # ID of the venue in VENUES, if the venue is a known one
+    venue_id: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the event as a state attribute friendly dict."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "time": self.time,
+            "venue": self.venue,
+            "datetime": self.datetime,
+            "key": self.key,
+            "venue_id": self.venue_id,
+        }
+
+    def as_json_dict(self) -> dict[str, Any]:
+        """Return the event with its datetime as an ISO 8601 string."""
+        data = self.as_dict()
+        if self.datetime:
+            data["datetime"] = self.datetime.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Event":
+        """Rebuild an event from a dict produced by as_dict."""
+        start = data.get("datetime")
+        if isinstance(start, str):
+            start = datetime.fromisoformat(start)
+        return cls(
+            name=data["name"],
+            description=data["description"],
+            time=data.get("time"),
+            venue=data.get("venue"),
+            datetime=start,
+            key=data["key"],
+            # Snapshots from before venue IDs were stored only have the name
+            venue_id=(
+                data["venue_id"]
+                if "venue_id" in data
+                else venue_id_for(data.get("venue"))
+            ),
+        )
@@ -0,0 +1,192 @@
+"""Event description parsing for Is There a Seattle Home Game Today?"""
+
+from datetime import date, datetime
+import hashlib
+import logging
+import re
+
+from .const import SEATTLE_TZ
+from .models import Event
+from .venues import remove_venues, venue_id_for, venue_name
+
+_LOGGER = logging.getLogger(__name__)
+
+# A single scan picks up both "at <venue>." phrases and clock times. The venue
+# is captured in a lookahead so that a time directly after "at" is still seen.
+_SCAN_RE = re.compile(
+    r"(?P<starts>starts\s+)?(?P<at>at)\s+"
+    r"(?=(?P<venue>[^.]+?)(?:\.|$))"
+    r"(?P<at_time>\d{1,2}:\d{2}\s*(?:[ap]m|(?P<at_dotted>[ap]\.m\.)))?"
+    r"|\b(?P<time>\d{1,2}:\d{2}\s*(?:[ap]m|(?P<dotted>[ap]\.m\.)))",
+    re.IGNORECASE,
+)
+# "at 7:05 p.m.", "at 7pm" and the like name a time, not a venue. The venue
+# capture ends at the first ".", so "7 p.m." arrives as "7 p".
+_CLOCK_PREFIX_RE = re.compile(r"\d{1,2}(?::\d{2}|\s*[ap](?:\.|m\b|$))", re.IGNORECASE)
+# A start time after the venue, "at <venue> at 8:00 PM" or "at <venue>, 8 PM"
+_TIME_SUFFIX_RE = re.compile(
+    r"(?:\s+at\s+|\s*,\s*)\d{1,2}(?::\d{2}(?:\s*[ap]\.?m?)?|\s*[ap]\.?m?)\.?$",
+    re.IGNORECASE,
+)
+# Times and the words leading up to them, left out of event keys
+_TIME_PHRASE_RE = re.compile(
+    r"(?:\b(?:starts\s+)?at\s+)?\b\d{1,2}:\d{2}\s*(?:[ap]\.m\.|[ap]m\b)?",
+    re.IGNORECASE,
+)
+_WORD_RE = re.compile(r"\w+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_DOTTED_MERIDIEM_RE = re.compile(r"([ap])\.m\.", re.IGNORECASE)
+_CLOCK_RE = re.compile(r"(\d{1,2}):(\d{1,2})\s*([ap])m", re.IGNORECASE)
+
+# Lower is better: "starts at 3:04 PM", "at 3:04 PM", "3:04 PM", "3:04 p.m."
+_PRIORITY_STARTS_AT = 0
+_PRIORITY_AT = 1
+_PRIORITY_BARE = 2
+_PRIORITY_DOTTED = 3
+
+
+def _is_word_char(text: str, index: int) -> bool:
+    """Return true if the character at index is a regex word character."""
+    return index < len(text) and (text[index].isalnum() or text[index] == "_")
+
+
+def _normalize_time(time_str: str) -> str:
+    """Normalize spacing and AM/PM notation of a matched time."""
+    time_str = _WHITESPACE_RE.sub(" ", time_str).strip()
+    time_str = _DOTTED_MERIDIEM_RE.sub(r"\1m", time_str)
+    return time_str.upper()
+
+
+def extract_time_and_venue(description: str) -> tuple[str | None, str | None]:
+    """Extract the start time and an "at <venue>." phrase in one pass."""
+    venue = None
+    best_time = None
+    best_priority = None
+
+    for match in _SCAN_RE.finditer(description):
+        if match.group("at") is not None:
+            # Venue phrases are matched case-sensitively on a lowercase "at"
+            # that starts a word, times still count after "that" and the like
+            at_start = match.start("at")
+            if (
+                venue is None
+                and match.group("at") == "at"
+                and not (at_start and _is_word_char(description, at_start - 1))
+                and not _CLOCK_PREFIX_RE.match(match.group("venue"))
+            ):
+                venue = _TIME_SUFFIX_RE.sub("", match.group("venue")).strip() or None
+            time_str = match.group("at_time")
+            if match.group("at_dotted"):
+                # Dotted times rank lowest and need a word boundary, wherever
+                # they appear
+                if _is_word_char(description, match.end()):
+                    time_str = None
+                priority = _PRIORITY_DOTTED
+            elif match.group("starts"):
+                priority = _PRIORITY_STARTS_AT
+            else:
+                priority = _PRIORITY_AT
+        else:
+            # Bare times need a word boundary after them, e.g. "3:04 PM"
+            if _is_word_char(description, match.end()):
+                continue
+            time_str = match.group("time")
+            priority = _PRIORITY_DOTTED if match.group("dotted") else _PRIORITY_BARE
+
+        if time_str and (best_priority is None or priority < best_priority):
+            best_time = time_str
+            best_priority = priority
+
+    return (_normalize_time(best_time) if best_time else None), venue
+
+
+def validate_payload(payload) -> dict:
+    """Check that a decoded todays_events.json has the expected shape."""
+    if not isinstance(payload, dict):
+        raise ValueError("Payload is not a JSON object")
+    if not isinstance(payload.get("date"), str):
+        raise ValueError("Payload has no date")
+    events = payload.get("events")
+    if not isinstance(events, list) or not all(
+        isinstance(event, dict) for event in events
+    ):
+        raise ValueError("Payload has no list of events")
+    return payload
+
+
+def parse_event_date(date_str: str) -> date | None:
+    """Parse the payload's date once for all of its events."""
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_time_to_datetime(
+    time_str: str | None, event_date: date | None
+) -> datetime | None:
+    """Combine a "3:04 PM" style time with the event date in Seattle time."""
+    if not time_str or event_date is None:
+        return None
+
+    match = _CLOCK_RE.fullmatch(time_str.strip())
+    if match:
+        hour, minute = int(match.group(1)), int(match.group(2))
+        if 1 <= hour <= 12 and minute < 60:
+            hour = hour % 12 + (12 if match.group(3).lower() == "p" else 0)
+            return datetime(
+                event_date.year,
+                event_date.month,
+                event_date.day,
+                hour,
+                minute,
+                tzinfo=SEATTLE_TZ,
+            )
+
+    _LOGGER.debug("Could not parse time %s", time_str)
+    return None
+
+
+def process_event(event: dict, event_date: date | None) -> Event:
+    """Process a single raw event to extract all information."""
+    description = event.get("description", "")
+    event_time = event.get("local_time")
+
+    extracted_time, venue = extract_time_and_venue(description)
+    key = event_key(event.get("name", event.get("title", "")), description, venue)
+    # Known venues are recognized anywhere in the text and named consistently,
+    # the "at <venue>." phrase is only a fallback for other venues
+    venue_id = venue_id_for(description)
+    if venue_id is not None:
+        venue = venue_name(venue_id)
+    if not event_time:
+        event_time = extracted_time
+
+    name = event.get("name", event.get("title", ""))
+    if not name:
+        name = description[:252] + "..." if len(description) > 255 else description
+
+    return Event(
+        name=name,
+        description=description,
+        time=event_time,
+        venue=venue,
+        datetime=parse_time_to_datetime(event_time, event_date),
+        key=key,
+        venue_id=venue_id,
+    )
+
+
+def event_key(name: str, description: str, venue: str | None = None) -> str:
+    """Return an identifier for an event that survives edits to its time or venue.
+
+    The description usually names the start time and venue, so they are left
+    out, along with case, punctuation and spacing.
+    """
+    text = _TIME_PHRASE_RE.sub(" ", description)
+    if venue:
+        text = text.replace(venue, " ")
+    identity = " ".join(_WORD_RE.findall(remove_venues(text).casefold()))
+    return hashlib.sha1(
+        f"{name}\n{identity}".encode(), usedforsecurity=False
+    ).hexdigest()[:12]
@@ -0,0 +1,26 @@
+"""Outbound request rate limiting for Seattle Home Game Monitor."""
+
+from time import monotonic
+
+
+class TokenBucket:
+    """Token bucket allowing short bursts while capping the sustained rate."""
+
+    def __init__(self, capacity: int, refill_seconds: float) -> None:
+        """Initialize a full bucket that regains one token per refill period."""
+        self.capacity = capacity
+        self.refill_seconds = refill_seconds
+        self._tokens = float(capacity)
+        self._updated = monotonic()
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available."""
+        now = monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) / self.refill_seconds
+        )
+        self._updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
@@ -0,0 +1,83 @@
+"""Multi-day schedule for Is There a Seattle Home Game Today?"""
+
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import date, datetime, time, timedelta
+
+from .const import DEFAULT_EVENT_DURATION, SEATTLE_TZ
+from .models import Event
+
+_SORT_SENTINEL = datetime.max.replace(tzinfo=SEATTLE_TZ)
+
+
+def event_span(day: date, event: Event) -> tuple[datetime, datetime]:
+    """Return when an event starts and ends, untimed events taking all day."""
+    if event.datetime:
+        return event.datetime, event.datetime + DEFAULT_EVENT_DURATION
+    start = datetime.combine(day, time.min, SEATTLE_TZ)
+    return start, start + timedelta(days=1)
+
+
+class Schedule:
+    """Immutable events by day, with the days sorted for range queries."""
+
+    __slots__ = ("_dates", "_days")
+
+    def __init__(self, days: Mapping[date, Iterable[Event]]) -> None:
+        """Index the events of each day."""
+        self._days = {
+            day: tuple(
+                sorted(
+                    events,
+                    key=lambda e: (e.datetime is None, e.datetime or _SORT_SENTINEL),
+                )
+            )
+            for day, events in days.items()
+        }
+        self._dates = sorted(day for day, events in self._days.items() if events)
+
+    def __len__(self) -> int:
+        """Return the number of days with events."""
+        return len(self._dates)
+
+    @property
+    def first_day(self) -> date | None:
+        """Return the first day with events."""
+        return self._dates[0] if self._dates else None
+
+    @property
+    def last_day(self) -> date | None:
+        """Return the last day with events."""
+        return self._dates[-1] if self._dates else None
+
+    def days_between(
+        self, start: date, end: date
+    ) -> Iterator[tuple[date, tuple[Event, ...]]]:
+        """Yield the days in [start, end) that have events, in order."""
+        for day in self._dates[
+            bisect_left(self._dates, start) : bisect_left(self._dates, end)
+        ]:
+            yield day, self._days[day]
+
+    def events_between(
+        self, start: datetime, end: datetime
+    ) -> list[tuple[date, Event]]:
+        """Return the events overlapping [start, end)."""
+        first = (start - DEFAULT_EVENT_DURATION).astimezone(SEATTLE_TZ).date()
+        last = end.astimezone(SEATTLE_TZ).date() + timedelta(days=1)
+        result = []
+        for day, events in self.days_between(first, last):
+            for event in events:
+                event_start, event_end = event_span(day, event)
+                if event_start < end and event_end > start:
+                    result.append((day, event))
+        return result
+
+    def current_or_next(self, now: datetime) -> tuple[date, Event] | None:
+        """Return the event under way, or else the next one to start."""
+        first = (now - DEFAULT_EVENT_DURATION).astimezone(SEATTLE_TZ).date()
+        for day, events in self.days_between(first, date.max):
+            for event in events:
+                if event_span(day, event)[1] > now:
+                    return day, event
+        return None
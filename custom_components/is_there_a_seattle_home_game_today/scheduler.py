@@ -0,0 +1,101 @@
+"""Adaptive polling schedule for Seattle Home Game Monitor."""
+
+from collections import deque
+from datetime import date, datetime, timedelta
+import random
+
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    FAST_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    PUBLISH_HISTORY_SIZE,
+    PUBLISH_WINDOW_MARGIN,
+    PUBLISH_WINDOW_QUANTILES,
+    SCAN_INTERVAL_JITTER,
+)
+
+
+def _quantile(values: list[int], fraction: float) -> int:
+    """Return the nearest-rank quantile of sorted values."""
+    return values[int(fraction * (len(values) - 1) + 0.5)]
+
+
+class PublishScheduler:
+    """Learn when the upstream publishes and pick the next poll interval."""
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        # Minutes after local midnight at which new data was first seen
+        self._observations: deque[int] = deque(maxlen=PUBLISH_HISTORY_SIZE)
+        self._last_observed: date | None = None
+
+    def as_dict(self) -> dict:
+        """Return the learned state for persisting."""
+        return {
+            "observations": list(self._observations),
+            "last_observed": (
+                self._last_observed.isoformat() if self._last_observed else None
+            ),
+        }
+
+    def restore(self, data: dict) -> None:
+        """Restore state produced by as_dict."""
+        self._observations.extend(data.get("observations", []))
+        if last_observed := data.get("last_observed"):
+            self._last_observed = date.fromisoformat(last_observed)
+
+    def record_change(self, when: datetime) -> None:
+        """Record that new data was first seen at the given local time."""
+        # Later corrections on the same day would only widen the window
+        if self._last_observed == when.date():
+            return
+        self._last_observed = when.date()
+        self._observations.append(when.hour * 60 + when.minute)
+
+    @property
+    def publish_window(self) -> tuple[int, int] | None:
+        """Return the learned publish window in minutes after midnight."""
+        if not self._observations:
+            return None
+        observations = sorted(self._observations)
+        low, high = PUBLISH_WINDOW_QUANTILES
+        margin = int(PUBLISH_WINDOW_MARGIN.total_seconds() // 60)
+        return (
+            max(_quantile(observations, low) - margin, 0),
+            min(_quantile(observations, high) + margin, 24 * 60),
+        )
+
+    def next_interval(self, now: datetime, data_date: str | None) -> timedelta:
+        """Return how long to wait before the next poll."""
+        return self._jitter(self._base_interval(now, data_date))
+
+    def _base_interval(self, now: datetime, data_date: str | None) -> timedelta:
+        """Return the un-jittered interval for the current situation."""
+        window = self.publish_window
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        minute_of_day = now.hour * 60 + now.minute
+
+        if data_date == now.date().isoformat():
+            # Today's data is in, sleep until tomorrow's window opens
+            if window is None:
+                return DEFAULT_SCAN_INTERVAL
+            window_start = midnight + timedelta(days=1, minutes=window[0])
+            return min(max(window_start - now, FAST_SCAN_INTERVAL), MAX_SCAN_INTERVAL)
+
+        if window is None:
+            return DEFAULT_SCAN_INTERVAL
+
+        start, end = window
+        if start <= minute_of_day <= end:
+            return FAST_SCAN_INTERVAL
+        if minute_of_day < start:
+            window_start = midnight + timedelta(minutes=start)
+            return min(max(window_start - now, FAST_SCAN_INTERVAL), DEFAULT_SCAN_INTERVAL)
+
+        # The window has passed without new data, fall back to hourly polling
+        return DEFAULT_SCAN_INTERVAL
+
+    def _jitter(self, interval: timedelta) -> timedelta:
+        """Spread polls out so clients don't hit the upstream in lockstep."""
+        factor = random.uniform(1 - SCAN_INTERVAL_JITTER, 1 + SCAN_INTERVAL_JITTER)
+        return max(interval * factor, FAST_SCAN_INTERVAL)
@@ -0,0 +1,113 @@
+"""Season schedule files for Is There a Seattle Home Game Today?"""
+
+from datetime import date, datetime, timezone
+import re
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from .const import SEATTLE_TZ
+from .models import Event
+from .parser import event_key, parse_event_date, process_event, validate_payload
+from .venues import venue_id_for, venue_name
+
+_FOLDED_LINE_RE = re.compile(r"\r?\n[ \t]")
+_ICS_ESCAPE_RE = re.compile(r"\\([\\;,nN])")
+_ICS_PROPERTIES = ("SUMMARY", "DESCRIPTION", "LOCATION", "DTSTART")
+
+
+def parse_season_json(payload) -> dict[date, list[Event]]:
+    """Parse a list of days shaped like todays_events.json."""
+    days = payload.get("days") if isinstance(payload, dict) else payload
+    if not isinstance(days, list):
+        raise ValueError("Season file has no list of days")
+
+    result: dict[date, list[Event]] = {}
+    for day in days:
+        validate_payload(day)
+        event_date = parse_event_date(day["date"])
+        if event_date is None:
+            raise ValueError(f"Invalid date {day['date']!r}")
+        result.setdefault(event_date, []).extend(
+            process_event(event, event_date) for event in day["events"]
+        )
+    return result
+
+
+def _unescape(value: str) -> str:
+    """Undo iCalendar text escaping."""
+    return _ICS_ESCAPE_RE.sub(
+        lambda match: "\n" if match.group(1) in "nN" else match.group(1), value
+    )
+
+
+def _parse_ics_start(value: str, params: dict[str, str]) -> date | datetime:
+    """Parse a DTSTART value into a date or a Seattle time datetime."""
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        return datetime.strptime(value, "%Y%m%d").date()
+
+    start = datetime.strptime(value.removesuffix("Z"), "%Y%m%dT%H%M%S")
+    if value.endswith("Z"):
+        return start.replace(tzinfo=timezone.utc).astimezone(SEATTLE_TZ)
+    tz = SEATTLE_TZ
+    if tzid := params.get("TZID"):
+        try:
+            tz = ZoneInfo(tzid)
+        except (ZoneInfoNotFoundError, ValueError):
+            pass
+    return start.replace(tzinfo=tz).astimezone(SEATTLE_TZ)
+
+
+def _ics_event(properties: dict[str, tuple[str, dict[str, str]]]) -> tuple[date, Event]:
+    """Build an event from the properties of a VEVENT."""
+    start = _parse_ics_start(*properties["DTSTART"])
+    summary = _unescape(properties.get("SUMMARY", ("", {}))[0]).strip()
+    description = _unescape(properties.get("DESCRIPTION", ("", {}))[0]).strip()
+    location = _unescape(properties.get("LOCATION", ("", {}))[0]).strip()
+    description = description or summary
+    name = summary or description
+
+    venue_id = venue_id_for(location) or venue_id_for(description)
+    venue = venue_name(venue_id) if venue_id else (location or None)
+
+    # datetime is a subclass of date, so check for it first
+    if isinstance(start, datetime):
+        day = start.date()
+        meridiem = "PM" if start.hour >= 12 else "AM"
+        time = f"{start.hour % 12 or 12}:{start.minute:02d} {meridiem}"
+    else:
+        day, time, start = start, None, None
+
+    return day, Event(
+        name=name,
+        description=description,
+        time=time,
+        venue=venue,
+        datetime=start,
+        key=event_key(summary, description, location),
+        venue_id=venue_id,
+    )
+
+
+def parse_ics(text: str) -> dict[date, list[Event]]:
+    """Parse the VEVENTs of an iCalendar file."""
+    result: dict[date, list[Event]] = {}
+    properties: dict[str, tuple[str, dict[str, str]]] | None = None
+
+    for line in _FOLDED_LINE_RE.sub("", text).splitlines():
+        name, _, value = line.partition(":")
+        name, *raw_params = name.split(";")
+        name = name.upper()
+        if name == "BEGIN" and value.upper() == "VEVENT":
+            properties = {}
+        elif name == "END" and value.upper() == "VEVENT" and properties is not None:
+            if "DTSTART" in properties:
+                day, event = _ics_event(properties)
+                result.setdefault(day, []).append(event)
+            properties = None
+        elif properties is not None and name in _ICS_PROPERTIES:
+            params = {}
+            for param in raw_params:
+                key, _, param_value = param.partition("=")
+                params[key.upper()] = param_value.strip('"')
+            properties[name] = (value, params)
+
+    return result
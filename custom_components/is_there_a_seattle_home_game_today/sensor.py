@@ -1,12 +1,23 @@
 """Sensor platform for Is There a Seattle Home Game Today?"""
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import DOMAIN, CONF_LEAN_ATTRIBUTES, DEFAULT_LEAN_ATTRIBUTES, VENUES
+from .entity import SeattleHomeGameEntity, SeattleHomeGameTimelineEntity
+from .index import EventIndex
+
+# Shown by venue sensors once the last data is for a past day
+_NO_EVENTS_INDEX = EventIndex([])
 
 
 async def async_setup_entry(
@@ -17,19 +28,78 @@ async def async_setup_entry(
     """Set up Seattle Home Game sensors."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    sensors = [
-        LastPollSensor(coordinator),
-        EventDateSensor(coordinator),
-        EventCountSensor(coordinator),
-    ]
+    async_add_entities(
+        [
+            LastPollSensor(coordinator),
+            EventDateSensor(coordinator),
+            EventCountSensor(coordinator),
+            NextEventSensor(coordinator),
+            *(VenueEventCountSensor(coordinator, venue_id) for venue_id in VENUES),
+            RefreshTimingSensor(
+                coordinator, "fetch_ms", "Fetch Latency", UnitOfTime.MILLISECONDS
+            ),
+            RefreshTimingSensor(
+                coordinator, "process_ms", "Parse Time", UnitOfTime.MILLISECONDS
+            ),
+            RefreshTimingSensor(
+                coordinator, "payload_bytes", "Payload Size", UnitOfInformation.BYTES
+            ),
+        ]
+    )
+
+    entity_registry = er.async_get(hass)
+    event_sensors: dict[str, EventDetailSensor] = {}
+
+    # Event sensors are keyed by event identity, drop any that are no longer
+    # listed, as well as the fixed "Event 1" to "Event 5" slots of old versions
+    current_keys = (
+        coordinator.data.get("events_by_key", {}) if coordinator.data else {}
+    )
+    detail_prefix = EventDetailSensor.unique_id_prefix(entry)
+    slot_prefix = f"{entry.entry_id}_event_"
+    for registry_entry in er.async_entries_for_config_entry(
+        entity_registry, entry.entry_id
+    ):
+        unique_id = registry_entry.unique_id
+        if unique_id.startswith(detail_prefix):
+            stale = unique_id.removeprefix(detail_prefix) not in current_keys
+        else:
+            stale = (
+                unique_id.startswith(slot_prefix)
+                and unique_id.removeprefix(slot_prefix).isdigit()
+            )
+        if stale:
+            entity_registry.async_remove(registry_entry.entity_id)
+
+    @callback
+    def _async_sync_event_sensors() -> None:
+        """Add and remove event sensors as the day's events change."""
+        if not coordinator.data:
+            return
+        events_by_key = coordinator.data.get("events_by_key", {})
+
+        for key in [key for key in event_sensors if key not in events_by_key]:
+            sensor = event_sensors.pop(key)
+            if sensor.registry_entry is not None:
+                entity_registry.async_remove(sensor.entity_id)
+            else:
+                hass.async_create_task(sensor.async_remove())
 
-    for i in range(5):
-        sensors.append(EventDetailSensor(coordinator, i))
+        new_sensors = [
+            EventDetailSensor(coordinator, key)
+            for key in events_by_key
+            if key not in event_sensors
+        ]
+        for sensor in new_sensors:
+            event_sensors[sensor.event_key] = sensor
+        if new_sensors:
+            async_add_entities(new_sensors)
 
-    async_add_entities(sensors)
+    _async_sync_event_sensors()
+    entry.async_on_unload(coordinator.async_add_listener(_async_sync_event_sensors))
 
 
-class LastPollSensor(CoordinatorEntity, SensorEntity):
+class LastPollSensor(SeattleHomeGameEntity, SensorEntity):
     """Last poll time sensor."""
 
     def __init__(self, coordinator):
@@ -40,25 +110,17 @@ class LastPollSensor(CoordinatorEntity, SensorEntity):
         self._attr_device_class = "timestamp"
         self._attr_icon = "mdi:clock-check"
 
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
-            "name": "Seattle Home Game Monitor",
-            "manufacturer": "isthereaseattlehomegametoday.com",
-            "entry_type": "service",
-        }
+    def _rendered_state(self):
+        """Return the last poll time, which changes even on idle polls."""
+        return self.coordinator.last_poll
 
     @property
     def native_value(self):
         """Return the last poll time."""
-        if not self.coordinator.data:
-            return None
-        last_poll = self.coordinator.data.get("last_poll")
-        return last_poll if last_poll else None
+        return self.coordinator.last_poll
 
 
-class EventDateSensor(CoordinatorEntity, SensorEntity):
+class EventDateSensor(SeattleHomeGameEntity, SensorEntity):
     """Event date sensor."""
 
     def __init__(self, coordinator):
@@ -68,14 +130,9 @@ class EventDateSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"{coordinator.entry.entry_id}_event_date"
         self._attr_icon = "mdi:calendar"
 
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
-            "name": "Seattle Home Game Monitor",
-            "manufacturer": "isthereaseattlehomegametoday.com",
-            "entry_type": "service",
-        }
+    def _rendered_state(self):
+        """Return the event date."""
+        return self.native_value
 
     @property
     def native_value(self):
@@ -85,9 +142,11 @@ class EventDateSensor(CoordinatorEntity, SensorEntity):
         return self.coordinator.data.get("date")
 
 
-class EventCountSensor(CoordinatorEntity, SensorEntity):
+class EventCountSensor(SeattleHomeGameTimelineEntity, SensorEntity):
     """Event count sensor."""
 
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(self, coordinator):
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -95,89 +154,216 @@ class EventCountSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"{coordinator.entry.entry_id}_event_count"
         self._attr_icon = "mdi:counter"
 
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
-            "name": "Seattle Home Game Monitor",
-            "manufacturer": "isthereaseattlehomegametoday.com",
-            "entry_type": "service",
-        }
+    def _rendered_state(self):
+        """Return the number of events."""
+        return self.native_value
 
     @property
     def native_value(self):
         """Return the number of events."""
         if not self.coordinator.data:
             return None
+        if self.coordinator.outdated:
+            return 0
         return self.coordinator.data.get("event_count", 0)
 
 
-class EventDetailSensor(CoordinatorEntity, SensorEntity):
-    """Individual event detail sensor."""
+class NextEventSensor(SeattleHomeGameTimelineEntity, SensorEntity):
+    """Start time of the next event today."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(self, coordinator):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_name = "Next Event Starts At"
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_next_event"
+        self._attr_icon = "mdi:calendar-clock"
+
+    def _next_event(self):
+        """Return the next event to start."""
+        return self.coordinator.timeline.next_event(dt_util.now())
+
+    def _rendered_state(self):
+        """Return the next event to start."""
+        return self._next_event()
 
-    def __init__(self, coordinator, index):
+    @property
+    def native_value(self):
+        """Return when the next event starts."""
+        event = self._next_event()
+        return event.datetime if event else None
+
+    @property
+    def extra_state_attributes(self):
+        """Return details of the next event."""
+        event = self._next_event()
+        if event is None:
+            return None
+        return {"name": event.name, "venue": event.venue}
+
+
+class VenueEventCountSensor(SeattleHomeGameTimelineEntity, SensorEntity):
+    """Number of events today at one known venue."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator, venue_id):
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._index = index
-        self._attr_name = f"Event {index + 1}"
-        self._attr_unique_id = f"{coordinator.entry.entry_id}_event_{index}"
-        self._attr_icon = "mdi:calendar-text"
+        self._venue_id = venue_id
+        self._attr_name = f"{VENUES[venue_id][0]} Event Count"
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_{venue_id}_event_count"
+        self._attr_icon = "mdi:stadium"
 
     @property
-    def device_info(self):
+    def _index(self):
+        """Return the index of the current events."""
+        if not self.coordinator.data:
+            return None
+        if self.coordinator.outdated:
+            return _NO_EVENTS_INDEX
+        return self.coordinator.data.get("index")
+
+    def _rendered_state(self):
+        """Return the venue's events and which of them is next."""
+        index = self._index
+        if index is None:
+            return None
+        return (
+            index.by_venue_id.get(self._venue_id),
+            index.next_event(dt_util.now(), self._venue_id),
+        )
+
+    @property
+    def native_value(self):
+        """Return the number of events at the venue."""
+        index = self._index
+        if index is None:
+            return None
+        return index.count_for_venue_id(self._venue_id)
+
+    @property
+    def extra_state_attributes(self):
+        """Return the times of the venue's events."""
+        index = self._index
+        if index is None:
+            return None
+        next_event = index.next_event(dt_util.now(), self._venue_id)
         return {
-            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
-            "name": "Seattle Home Game Monitor",
-            "manufacturer": "isthereaseattlehomegametoday.com",
-            "entry_type": "service",
+            "times": [
+                event.time for event in index.by_venue_id.get(self._venue_id, ())
+            ],
+            "next_event_start": (
+                next_event.datetime.isoformat() if next_event else None
+            ),
         }
 
+
+class RefreshTimingSensor(SeattleHomeGameEntity, SensorEntity):
+    """Diagnostic sensor for one stage of the most recent refresh."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator, field, name, unit):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._field = field
+        self._attr_name = name
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_{field}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_icon = "mdi:timer-outline"
+        if unit == UnitOfInformation.BYTES:
+            self._attr_device_class = SensorDeviceClass.DATA_SIZE
+            self._attr_icon = "mdi:download"
+        else:
+            self._attr_device_class = SensorDeviceClass.DURATION
+            self._attr_suggested_display_precision = 1
+
+    def _rendered_state(self):
+        """Return the latest value of this stage."""
+        return self.native_value
+
+    @property
+    def native_value(self):
+        """Return the latest value of this stage."""
+        return self.coordinator.stats.latest_value(self._field)
+
+
+class EventDetailSensor(SeattleHomeGameTimelineEntity, SensorEntity):
+    """Individual event detail sensor."""
+
+    _unrecorded_attributes = frozenset({"description"})
+
+    def __init__(self, coordinator, event_key):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.event_key = event_key
+        self._lean = coordinator.entry.options.get(
+            CONF_LEAN_ATTRIBUTES, DEFAULT_LEAN_ATTRIBUTES
+        )
+        event = self._event
+        name = event.name if event else event_key
+        self._attr_name = f"Event: {name[:47] + '...' if len(name) > 50 else name}"
+        self._attr_unique_id = f"{self.unique_id_prefix(coordinator.entry)}{event_key}"
+        self._attr_icon = "mdi:calendar-text"
+
+    @staticmethod
+    def unique_id_prefix(entry):
+        """Return the unique ID prefix shared by all event sensors."""
+        return f"{entry.entry_id}_event_detail_"
+
+    @property
+    def _event(self):
+        """Return the event shown by this sensor, if it is still listed."""
+        if not self.coordinator.data or self.coordinator.outdated:
+            return None
+        return self.coordinator.data.get("events_by_key", {}).get(self.event_key)
+
+    def _rendered_state(self):
+        """Return the event shown by this sensor."""
+        return self._event
+
     @property
     def native_value(self):
         """Return the event name."""
-        if not self.coordinator.data:
+        event = self._event
+        if event is None:
             return None
-        events = self.coordinator.data.get("events", [])
-        if self._index < len(events):
-            event = events[self._index]
-            name = event.get("name") or event.get("description", "Event")
-            # Truncate long descriptions for the state value
-            if len(name) > 255:
-                name = name[:252] + "..."
-            return name
-        return "No event"
+        name = event.name or event.description or "Event"
+        # Truncate long descriptions for the state value
+        if len(name) > 255:
+            name = name[:252] + "..."
+        return name
 
     @property
     def extra_state_attributes(self):
         """Return extra attributes."""
-        if not self.coordinator.data:
+        event = self._event
+        if event is None:
             return None
-        events = self.coordinator.data.get("events", [])
-        if self._index < len(events):
-            event = events[self._index]
-            attrs = {
-                "description": event.get("description"),
-                "time": event.get("time"),
-                "venue": event.get("venue"),
-            }
-
-            # Add datetime if available
-            if event.get("datetime"):
-                attrs["datetime"] = event["datetime"].isoformat()
-
-            # Add time status
-            if event.get("time"):
-                attrs["has_time"] = True
-            else:
-                attrs["has_time"] = False
+        attrs = {
+            "time": event.time,
+            "venue": event.venue,
+        }
+        if not self._lean:
+            attrs["description"] = event.description
+
+        # Add datetime if available
+        if event.datetime:
+            attrs["datetime"] = event.datetime.isoformat()
 
-            return attrs
-        return {}
+        # Add time status
+        if event.time:
+            attrs["has_time"] = True
+        else:
+            attrs["has_time"] = False
+
+        return attrs
 
     @property
     def available(self):
         """Return if entity is available."""
-        if not self.coordinator.data:
-            return False
-        events = self.coordinator.data.get("events", [])
-        return self._index < len(events)
+        return super().available and self._event is not None
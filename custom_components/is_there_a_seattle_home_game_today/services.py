@@ -0,0 +1,158 @@
+"""Services for Is There a Seattle Home Game Today?"""
+
+from datetime import date, datetime, time, timedelta
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    DOMAIN,
+    SEATTLE_TZ,
+    SERVICE_GET_EVENTS,
+    SERVICE_GET_HISTORY,
+    VENUES,
+)
+from .index import EventIndex
+from .models import Event
+from .parser import parse_event_date
+from .venues import venue_id_for
+
+ATTR_VENUE = "venue"
+ATTR_START_DATE = "start_date"
+ATTR_END_DATE = "end_date"
+ATTR_AFTER = "after"
+ATTR_BEFORE = "before"
+
+GET_EVENTS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_VENUE): str,
+        vol.Optional(ATTR_START_DATE): cv.date,
+        vol.Optional(ATTR_END_DATE): cv.date,
+        vol.Optional(ATTR_AFTER): cv.time,
+        vol.Optional(ATTR_BEFORE): cv.time,
+    }
+)
+
+
+def _known_venue_id(venue: str | None) -> str | None:
+    """Return the ID of a known venue given by its ID, name or alias."""
+    if not venue:
+        return None
+    if venue.casefold() in VENUES:
+        return venue.casefold()
+    return venue_id_for(venue)
+
+
+def _matches(
+    event: Event,
+    venue: str | None,
+    venue_id: str | None,
+    after: time | None,
+    before: time | None,
+) -> bool:
+    """Return true if an event passes the venue and time of day filters."""
+    if venue_id is not None:
+        if event.venue_id != venue_id:
+            return False
+    elif venue and (not event.venue or venue.casefold() not in event.venue.casefold()):
+        return False
+    if after or before:
+        if event.datetime is None:
+            return False
+        start = event.datetime.time()
+        if (after and start < after) or (before and start >= before):
+            return False
+    return True
+
+
+def _candidates(
+    index: EventIndex,
+    day: date,
+    venue_id: str | None,
+    after: time | None,
+    before: time | None,
+) -> tuple[Event, ...] | None:
+    """Narrow the current day's events down with the index, if it can help."""
+    if venue_id is not None:
+        return index.by_venue_id.get(venue_id, ())
+    if after or before:
+        start = datetime.combine(day, after or time.min, SEATTLE_TZ)
+        if before:
+            end = datetime.combine(day, before, SEATTLE_TZ)
+        else:
+            end = datetime.combine(day + timedelta(days=1), time.min, SEATTLE_TZ)
+        return index.starting_between(start, end)
+    return None
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    def _coordinator():
+        """Return the coordinator of the config entry."""
+        coordinators = hass.data.get(DOMAIN, {})
+        if not coordinators:
+            raise ServiceValidationError("Seattle Home Game Monitor is not set up")
+        return next(iter(coordinators.values()))
+
+    async def async_get_events(call: ServiceCall) -> dict:
+        """Return matching events from memory, without a network request."""
+        coordinator = _coordinator()
+        data = coordinator.data or {}
+        venue = call.data.get(ATTR_VENUE)
+        venue_id = _known_venue_id(venue)
+        after = call.data.get(ATTR_AFTER)
+        before = call.data.get(ATTR_BEFORE)
+        if after and before and after >= before:
+            raise ServiceValidationError("after must be earlier than before")
+
+        if ATTR_START_DATE in call.data or ATTR_END_DATE in call.data:
+            start_date = call.data.get(ATTR_START_DATE, call.data.get(ATTR_END_DATE))
+            end_date = call.data.get(ATTR_END_DATE, start_date)
+            if end_date < start_date:
+                raise ServiceValidationError("end_date must not be before start_date")
+            days = list(
+                coordinator.schedule.days_between(
+                    start_date, end_date + timedelta(days=1)
+                )
+            )
+        elif (day := parse_event_date(data.get("date"))) is not None:
+            events = _candidates(data["index"], day, venue_id, after, before)
+            days = [(day, data["events"] if events is None else events)]
+        else:
+            days = []
+
+        return {
+            "date": data.get("date"),
+            "events": [
+                {**event.as_json_dict(), "date": day.isoformat()}
+                for day, day_events in days
+                for event in day_events
+                if _matches(event, venue, venue_id, after, before)
+            ],
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_EVENTS,
+        async_get_events,
+        schema=GET_EVENTS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def async_get_history(call: ServiceCall) -> dict:
+        """Return event counts of all days seen so far."""
+        venue = call.data.get(ATTR_VENUE)
+        # Unknown venues are counted under the name the website used
+        return _coordinator().history.as_dict(_known_venue_id(venue) or venue)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        async_get_history,
+        schema=vol.Schema({vol.Optional(ATTR_VENUE): str}),
+        supports_response=SupportsResponse.ONLY,
+    )
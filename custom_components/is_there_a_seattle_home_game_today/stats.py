@@ -0,0 +1,71 @@
+"""Refresh instrumentation for Seattle Home Game Monitor."""
+
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any
+
+from .const import STATS_HISTORY_SIZE
+
+OUTCOME_UPDATED = "updated"
+OUTCOME_NOT_MODIFIED = "not_modified"
+OUTCOME_UNCHANGED = "unchanged"
+OUTCOME_RATE_LIMITED = "rate_limited"
+OUTCOME_CIRCUIT_OPEN = "circuit_open"
+OUTCOME_FAILED = "failed"
+
+
+@dataclass(slots=True)
+class RefreshTiming:
+    """Timings and sizes of one refresh, stage by stage."""
+
+    started: datetime
+    outcome: str = OUTCOME_FAILED
+    fetch_ms: float | None = None
+    decode_ms: float | None = None
+    process_ms: float | None = None
+    payload_bytes: int | None = None
+
+
+class RefreshStats:
+    """Recent refresh timings and failure counters."""
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self.recent: deque[RefreshTiming] = deque(maxlen=STATS_HISTORY_SIZE)
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.attributes_ms: float | None = None
+
+    @property
+    def latest(self) -> RefreshTiming | None:
+        """Return the most recent refresh."""
+        return self.recent[-1] if self.recent else None
+
+    def latest_value(self, field: str) -> Any:
+        """Return the most recent non-empty value of a timing field."""
+        for timing in reversed(self.recent):
+            if (value := getattr(timing, field)) is not None:
+                return value
+        return None
+
+    def record(self, timing: RefreshTiming) -> None:
+        """Record a finished refresh."""
+        self.recent.append(timing)
+        if timing.outcome == OUTCOME_FAILED:
+            self.failures += 1
+            self.consecutive_failures += 1
+        else:
+            self.consecutive_failures = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats for diagnostics."""
+        return {
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "attributes_ms": self.attributes_ms,
+            "recent": [
+                {**asdict(timing), "started": timing.started.isoformat()}
+                for timing in self.recent
+            ],
+        }
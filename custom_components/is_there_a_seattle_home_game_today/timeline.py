@@ -0,0 +1,136 @@
+"""Event start and end scheduling for Seattle Home Game Monitor."""
+
+from collections.abc import Callable
+from datetime import datetime, time, timedelta
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_TRAFFIC_LOOKAHEAD,
+    DEFAULT_EVENT_DURATION,
+    DEFAULT_TRAFFIC_LOOKAHEAD,
+    SEATTLE_TZ,
+)
+from .index import EventIndex
+from .models import Event
+from .traffic import TrafficWindows
+
+
+class EventTimeline:
+    """Fire callbacks at event boundaries and traffic window boundaries."""
+
+    def __init__(self, coordinator) -> None:
+        """Initialize the timeline."""
+        self._coordinator = coordinator
+        options = coordinator.entry.options
+        self.traffic_lookahead = timedelta(
+            minutes=options.get(CONF_TRAFFIC_LOOKAHEAD, DEFAULT_TRAFFIC_LOOKAHEAD)
+        )
+        self.traffic = TrafficWindows([])
+        self._index = EventIndex([])
+        self._source = None
+        self._unsub_points: list[CALLBACK_TYPE] = []
+        self._unsub_midnight: CALLBACK_TYPE | None = None
+        self._listeners: list[Callable[[], None]] = []
+
+    @staticmethod
+    def event_end(event: Event) -> datetime:
+        """Return the estimated end of an event with a start time."""
+        return event.datetime + DEFAULT_EVENT_DURATION
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Follow the coordinator's events until the returned callback is called."""
+        remove_listener = self._coordinator.async_add_listener(
+            self._async_coordinator_updated
+        )
+        self._async_coordinator_updated()
+        self._async_schedule_midnight()
+
+        @callback
+        def stop() -> None:
+            remove_listener()
+            self._async_cancel_points()
+            if self._unsub_midnight is not None:
+                self._unsub_midnight()
+                self._unsub_midnight = None
+
+        return stop
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call update_callback at every scheduled boundary."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    def in_progress(self, now: datetime) -> tuple[Event, ...]:
+        """Return the events under way at the given time."""
+        return self._index.in_progress(now)
+
+    def next_event(self, now: datetime) -> Event | None:
+        """Return the first event starting after the given time."""
+        return self._index.next_event(now)
+
+    @callback
+    def _async_coordinator_updated(self) -> None:
+        """Reschedule when the coordinator hands over new events."""
+        data = self._coordinator.data or {}
+        events = data.get("events", [])
+        if events is self._source:
+            return
+        self._source = events
+
+        self._index = data.get("index") or EventIndex([])
+        timed = self._index.timed
+        self.traffic = TrafficWindows.from_events(
+            timed, self._coordinator.entry.options
+        )
+
+        self._async_cancel_points()
+        now = dt_util.now()
+        points = {event.datetime for event in timed}
+        points.update(self.event_end(event) for event in timed)
+        points.update(self.traffic.boundaries(self.traffic_lookahead))
+        for point in sorted(points):
+            if point > now:
+                self._unsub_points.append(
+                    async_track_point_in_time(
+                        self._coordinator.hass, self._async_point_reached, point
+                    )
+                )
+
+    @callback
+    def _async_cancel_points(self) -> None:
+        """Cancel all scheduled start and end callbacks."""
+        for unsub in self._unsub_points:
+            unsub()
+        self._unsub_points.clear()
+
+    @callback
+    def _async_schedule_midnight(self) -> None:
+        """Call listeners when the day changes in Seattle, every day."""
+        tomorrow = dt_util.now(SEATTLE_TZ).date() + timedelta(days=1)
+        self._unsub_midnight = async_track_point_in_time(
+            self._coordinator.hass,
+            self._async_midnight,
+            datetime.combine(tomorrow, time.min, SEATTLE_TZ),
+        )
+
+    @callback
+    def _async_midnight(self, now: datetime) -> None:
+        """Let entities drop yesterday's events once the day has changed."""
+        self._async_schedule_midnight()
+        self._async_point_reached(now)
+
+    @callback
+    def _async_point_reached(self, _now: datetime) -> None:
+        """Notify listeners that an event or traffic window started or ended."""
+        for update_callback in list(self._listeners):
+            update_callback()
@@ -0,0 +1,95 @@
+"""Traffic impact windows for Seattle Home Game Monitor."""
+
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timedelta
+from typing import Any
+
+from .const import (
+    CONF_ARRIVAL_MINUTES,
+    CONF_EGRESS_MINUTES,
+    DEFAULT_ARRIVAL_MINUTES,
+    DEFAULT_EGRESS_MINUTES,
+    DEFAULT_EVENT_DURATION,
+    VENUES,
+)
+from .models import Event
+
+
+def venue_windows(
+    venue_id: str | None, options: Mapping[str, Any]
+) -> tuple[timedelta, timedelta]:
+    """Return the arrival and egress windows configured for a venue."""
+    if venue_id in VENUES:
+        _name, arrival, egress = VENUES[venue_id]
+        return (
+            timedelta(
+                minutes=options.get(CONF_ARRIVAL_MINUTES.format(venue_id), arrival)
+            ),
+            timedelta(
+                minutes=options.get(CONF_EGRESS_MINUTES.format(venue_id), egress)
+            ),
+        )
+    return (
+        timedelta(minutes=DEFAULT_ARRIVAL_MINUTES),
+        timedelta(minutes=DEFAULT_EGRESS_MINUTES),
+    )
+
+
+class TrafficWindows:
+    """Sorted, merged intervals during which traffic is impacted."""
+
+    def __init__(self, intervals: Iterable[tuple[datetime, datetime]]) -> None:
+        """Merge overlapping intervals into a sorted index."""
+        merged: list[list[datetime]] = []
+        for start, end in sorted(intervals):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        self.windows = [(start, end) for start, end in merged]
+        self._starts = [start for start, _ in self.windows]
+
+    @classmethod
+    def from_events(
+        cls, events: Iterable[Event], options: Mapping[str, Any]
+    ) -> "TrafficWindows":
+        """Build the windows around every event with a start time."""
+        intervals = []
+        for event in events:
+            if event.datetime is None:
+                continue
+            arrival, egress = venue_windows(event.venue_id, options)
+            intervals.append(
+                (
+                    event.datetime - arrival,
+                    event.datetime + DEFAULT_EVENT_DURATION + egress,
+                )
+            )
+        return cls(intervals)
+
+    def window_at(self, when: datetime) -> tuple[datetime, datetime] | None:
+        """Return the window covering the given time, if any."""
+        index = bisect_right(self._starts, when) - 1
+        if index >= 0 and when < self.windows[index][1]:
+            return self.windows[index]
+        return None
+
+    def next_window(self, when: datetime) -> tuple[datetime, datetime] | None:
+        """Return the current window, or the next one to open."""
+        if window := self.window_at(when):
+            return window
+        index = bisect_right(self._starts, when)
+        return self.windows[index] if index < len(self.windows) else None
+
+    def impacted_within(self, when: datetime, horizon: timedelta) -> bool:
+        """Return true if traffic is impacted at any point in the next horizon."""
+        window = self.next_window(when)
+        return window is not None and window[0] <= when + horizon
+
+    def boundaries(self, lookahead: timedelta) -> set[datetime]:
+        """Return every time at which an impacted state can flip."""
+        points = set()
+        for start, end in self.windows:
+            points.update((start, end, start - lookahead))
+        return points
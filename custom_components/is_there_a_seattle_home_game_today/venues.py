@@ -0,0 +1,48 @@
+"""Known venues for Seattle Home Game Monitor."""
+
+import re
+
+from .const import VENUE_ALIASES, VENUES
+
+
+def _normalize(name: str) -> str:
+    """Return a name lowercased with its whitespace collapsed."""
+    return " ".join(name.lower().split())
+
+
+# Every name and alias, normalized, mapped to its canonical venue ID
+_VENUE_IDS = {
+    _normalize(alias): venue_id
+    for venue_id, (name, _arrival, _egress) in VENUES.items()
+    for alias in (name, *VENUE_ALIASES.get(venue_id, ()))
+}
+
+# All names in one alternation, longest first so that the most specific name
+# wins, e.g. "Key Arena" over a hypothetical "Key"
+_VENUE_RE = re.compile(
+    r"\b(?:"
+    + "|".join(
+        r"\s+".join(re.escape(word) for word in alias.split())
+        for alias in sorted(_VENUE_IDS, key=len, reverse=True)
+    )
+    + r")\b",
+    re.IGNORECASE,
+)
+
+
+def venue_id_for(text: str | None) -> str | None:
+    """Return the ID of the first known venue named in the text."""
+    if not text:
+        return None
+    match = _VENUE_RE.search(text)
+    return _VENUE_IDS[_normalize(match.group())] if match else None
+
+
+def remove_venues(text: str) -> str:
+    """Return the text with the names of known venues blanked out."""
+    return _VENUE_RE.sub(" ", text)
+
+
+def venue_name(venue_id: str) -> str:
+    """Return the canonical name of a known venue."""
+    return VENUES[venue_id][0]
@@ -0,0 +1,36 @@
+"""Offline benchmark for Is There a Seattle Home Game Today?
+
+Runs tests/test_benchmark.py, which sets up the integration against a local
+stub server and times refreshes of synthetic payloads of several sizes and
+of the recorded descriptions. Results are compared against the baseline
+committed in tests/benchmark_baseline.json, a regression or a case without
+a baseline fails. A plain pytest run skips these benchmarks.
+
+Usage:
+    python scripts/benchmark.py                    # compare against baseline
+    python scripts/benchmark.py --update-baseline  # record a new baseline
+"""
+
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def main() -> int:
+    """Run the benchmarks and return pytest's exit code."""
+    return pytest.main(
+        [
+            "-c",
+            str(ROOT / "pytest.ini"),
+            str(ROOT / "tests" / "test_benchmark.py"),
+            "--refresh-benchmark",
+            *sys.argv[1:],
+        ]
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
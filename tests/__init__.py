@@ -0,0 +1 @@
+"""Tests for Is There a Seattle Home Game Today?"""
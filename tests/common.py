@@ -0,0 +1,76 @@
+"""Helpers shared by the tests."""
+
+from datetime import date, datetime
+import json
+from pathlib import Path
+
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.is_there_a_seattle_home_game_today.const import SEATTLE_TZ
+
+VENUES = ["Lumen Field", "T-Mobile Park", "Climate Pledge Arena", "Husky Stadium"]
+DESCRIPTIONS = [
+    "The Seattle Mariners play the Houston Astros at {venue}. It starts at {time}.",
+    "Seattle Kraken vs. Vancouver Canucks at {venue}. The game is at {time}.",
+    "Concert tonight at {venue}",
+    "Seattle Sounders FC host the Portland Timbers at {venue}, kickoff {time}.",
+]
+# Descriptions as the website writes them
+RECORDED_DESCRIPTIONS = json.loads(
+    Path(__file__).with_name("fixtures").joinpath("descriptions.json").read_text()
+)
+
+
+def today() -> date:
+    """Return today's date in Seattle."""
+    return dt_util.now(SEATTLE_TZ).date()
+
+
+def build_events(count: int, shift: int = 0) -> list[dict]:
+    """Return synthetic raw events, with every start moved by shift minutes."""
+    events = []
+    for i in range(count):
+        minutes = (i * 7 + shift) % (12 * 60)
+        events.append(
+            {
+                "description": DESCRIPTIONS[i % len(DESCRIPTIONS)].format(
+                    venue=VENUES[i % len(VENUES)],
+                    time=f"{minutes // 60 or 12}:{minutes % 60:02d} PM",
+                ),
+                "name": f"Event {i}",
+            }
+        )
+    return events
+
+
+def build_payload(
+    count: int, shift: int = 0, day: date | None = None
+) -> dict:
+    """Return a todays_events.json payload with count synthetic events."""
+    return {
+        "date": (day or today()).isoformat(),
+        "events": build_events(count, shift),
+    }
+
+
+def build_recorded_payload(shift: int = 0) -> dict:
+    """Return a payload of the recorded descriptions, rotated by shift."""
+    events = [
+        {"description": description, "name": f"Event {i}"}
+        for i, description in enumerate(RECORDED_DESCRIPTIONS)
+    ]
+    shift %= len(events)
+    return {"date": today().isoformat(), "events": events[shift:] + events[:shift]}
+
+
+async def async_move_to(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, when: datetime
+) -> None:
+    """Move the clock to when and run everything scheduled up to then."""
+    freezer.move_to(when)
+    async_fire_time_changed(hass, when)
+    await hass.async_block_till_done()
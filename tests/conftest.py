@@ -0,0 +1,121 @@
+"""Fixtures for Is There a Seattle Home Game Today? tests."""
+
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from unittest.mock import patch
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.is_there_a_seattle_home_game_today.const import DOMAIN
+
+from .common import build_payload
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the options that run the refresh benchmarks."""
+    parser.addoption(
+        "--refresh-benchmark",
+        action="store_true",
+        help="Run the refresh benchmarks and check them against the baseline",
+    )
+    parser.addoption(
+        "--update-baseline",
+        action="store_true",
+        help="Run the refresh benchmarks and record them as the new baseline",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip the refresh benchmarks unless asked for.
+
+    Their baseline was timed on one machine, so they are a job of their own
+    rather than part of every test run.
+    """
+    if config.getoption("--refresh-benchmark") or config.getoption(
+        "--update-baseline"
+    ):
+        return
+    skip = pytest.mark.skip(reason="run with --refresh-benchmark")
+    for item in items:
+        if "refresh_benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load the integration from custom_components."""
+    return
+
+
+class StubServer:
+    """Local stand-in for isthereaseattlehomegametoday.com."""
+
+    def __init__(self) -> None:
+        """Serve an empty day until a test says otherwise."""
+        self.payload: dict = build_payload(0)
+        self.handler: Handler | None = None
+        self.requests: list[web.Request] = []
+        app = web.Application()
+        app.router.add_get("/todays_events.json", self._handle)
+        self.server = TestServer(app)
+
+    @property
+    def url(self) -> str:
+        """Return the URL of the events file."""
+        return str(self.server.make_url("/todays_events.json"))
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        """Count the request and answer it."""
+        self.requests.append(request)
+        if self.handler is not None:
+            return await self.handler(request)
+        return web.json_response(self.payload)
+
+
+@pytest.fixture
+async def stub_server(socket_enabled) -> AsyncGenerator[StubServer]:
+    """Start a stub server and point the integration at it."""
+    stub = StubServer()
+    await stub.server.start_server()
+    with (
+        patch(
+            "custom_components.is_there_a_seattle_home_game_today.coordinator.API_URL",
+            stub.url,
+        ),
+        patch(
+            "custom_components.is_there_a_seattle_home_game_today.config_flow.API_URL",
+            stub.url,
+        ),
+    ):
+        yield stub
+    await stub.server.close()
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Add a config entry for the integration."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, title="Seattle Home Game Monitor", unique_id=DOMAIN, data={}
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def setup_integration(
+    hass: HomeAssistant, config_entry: MockConfigEntry, stub_server: StubServer
+) -> MockConfigEntry:
+    """Set up the integration against the stub server."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    return config_entry
@@ -0,0 +1,156 @@
+"""Refresh benchmarks against the committed baseline.
+
+Every case sets up the integration against a local stub server, then times
+refreshes of a payload that changes every round, so each round fetches,
+parses and writes the state of every entity. The synthetic cases move
+every event's start time, the recorded case rotates the descriptions in
+tests/fixtures/descriptions.json. The event cache is cleared before each
+round so that every event is parsed.
+
+The benchmarks only run with ``--refresh-benchmark``, record a new baseline
+with ``--update-baseline``.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable
+from functools import partial
+import json
+from pathlib import Path
+import statistics
+from time import perf_counter
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
+from homeassistant.core import HomeAssistant
+
+from custom_components.is_there_a_seattle_home_game_today.const import DOMAIN
+
+from .common import build_payload, build_recorded_payload
+from .conftest import StubServer
+
+pytestmark = pytest.mark.refresh_benchmark
+
+BASELINE_PATH = Path(__file__).with_name("benchmark_baseline.json")
+PAYLOADS: dict[str, Callable[[int], dict]] = {
+    **{
+        f"{count}_events": partial(build_payload, count)
+        for count in (0, 1, 5, 50, 500, 2000, 5000)
+    },
+    "recorded": build_recorded_payload,
+}
+ROUNDS = 5
+HOME_GAME = "binary_sensor.is_there_a_seattle_home_game_today"
+# A case fails if it is this much slower than its baseline, plus the slack
+# that keeps sub-millisecond stages from failing on noise
+TOLERANCE = 2.0
+SLACK_MS = 5.0
+SLACK_KIB = 256.0
+
+
+def _timed(spent: dict[str, float], stage: str, func: Callable) -> Callable:
+    """Wrap func so the time spent in it adds up under stage."""
+
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            spent[stage] += (perf_counter() - start) * 1000
+
+    return wrapper
+
+
+async def _async_run_round(
+    hass: HomeAssistant, stub_server: StubServer, payload: dict
+) -> dict[str, float]:
+    """Serve a changed payload and measure one refresh."""
+    coordinator = hass.data[DOMAIN][next(iter(hass.data[DOMAIN]))]
+    entity = hass.data[BINARY_SENSOR_DOMAIN].get_entity(HOME_GAME)
+    coordinator.event_cache.clear()
+    stub_server.payload = payload
+    spent: dict[str, float] = defaultdict(float)
+
+    with (
+        patch.object(
+            coordinator,
+            "_process_event",
+            _timed(spent, "process_ms", coordinator._process_event),
+        ),
+        patch.object(
+            entity,
+            "_attributes_for",
+            _timed(spent, "attributes_ms", entity._attributes_for),
+        ),
+    ):
+        tracemalloc.start()
+        start = perf_counter()
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        finished = perf_counter()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "refresh_ms": (finished - start) * 1000,
+        "process_ms": spent["process_ms"],
+        "attributes_ms": spent["attributes_ms"],
+        "peak_kib": peak / 1024,
+    }
+
+
+def _regressions(case: str, results: dict, baseline: dict) -> list[str]:
+    """Return every metric of a case that regressed past its baseline."""
+    regressions = []
+    for metric, value in results.items():
+        expected = baseline[metric]
+        slack = SLACK_KIB if metric == "peak_kib" else SLACK_MS
+        if value > expected * TOLERANCE + slack:
+            regressions.append(f"{case} {metric}: {value} (baseline {expected})")
+    return regressions
+
+
+@pytest.mark.parametrize("case", PAYLOADS)
+async def test_refresh_benchmark(
+    hass: HomeAssistant,
+    config_entry,
+    stub_server: StubServer,
+    request: pytest.FixtureRequest,
+    case: str,
+) -> None:
+    """A refresh of the case's payload stays within its baseline."""
+    build = PAYLOADS[case]
+    stub_server.payload = build(0)
+    with patch(
+        "custom_components.is_there_a_seattle_home_game_today.coordinator.OUTBOUND_REQUEST_BURST",
+        ROUNDS + 1,
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    rounds = [
+        await _async_run_round(hass, stub_server, build(shift))
+        for shift in range(1, ROUNDS + 1)
+    ]
+    assert len(stub_server.requests) == ROUNDS + 1
+    assert hass.states.get("sensor.event_count").state == str(
+        len(stub_server.payload["events"])
+    )
+
+    results = {
+        metric: round(statistics.median(r[metric] for r in rounds), 3)
+        for metric in rounds[0]
+    }
+
+    baselines = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    if request.config.getoption("--update-baseline"):
+        baselines[case] = results
+        BASELINE_PATH.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        return
+
+    if case not in baselines:
+        pytest.fail(f"No baseline for {case}, run with --update-baseline")
+    regressions = _regressions(case, results, baselines[case])
+    assert not regressions, "\n".join(regressions)
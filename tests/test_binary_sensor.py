@@ -0,0 +1,148 @@
+"""Tests for the Is There a Seattle Home Game Today? binary sensors."""
+
+from datetime import datetime, time, timedelta
+from time import perf_counter
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
+from homeassistant.core import HomeAssistant
+
+from custom_components.is_there_a_seattle_home_game_today.const import (
+    DOMAIN,
+    SEATTLE_TZ,
+)
+from custom_components.is_there_a_seattle_home_game_today.parser import (
+    process_event,
+)
+
+from .common import build_payload, today
+from .conftest import StubServer
+
+HOME_GAME = "binary_sensor.is_there_a_seattle_home_game_today"
+
+
+def _same_venue_events(count: int) -> list:
+    """Return count events at one venue, each at its own time of day."""
+    events = []
+    for i in range(count):
+        minutes = i * (24 * 60 // count)
+        hour, minute = divmod(minutes, 60)
+        clock = f"{hour % 12 or 12}:{minute:02d} {'PM' if hour >= 12 else 'AM'}"
+        events.append(
+            process_event(
+                {"description": f"Game at Lumen Field. It starts at {clock}."},
+                today(),
+            )
+        )
+    return events
+
+
+def _summary_seconds(entity, events: list) -> float:
+    """Return the best time of summarizing events."""
+    best = float("inf")
+    for _ in range(5):
+        start = perf_counter()
+        entity._generate_summary(events)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+async def test_grouping_scales_linearithmically(
+    hass: HomeAssistant, setup_integration
+) -> None:
+    """Sixteen times the times at a venue take nowhere near 256 times as long."""
+    entity = hass.data[BINARY_SENSOR_DOMAIN].get_entity(HOME_GAME)
+    small, large = _same_venue_events(90), _same_venue_events(1440)
+
+    ratio = _summary_seconds(entity, large) / _summary_seconds(entity, small)
+
+    # Linear or n log n grouping stays around 16, quadratic is near 256
+    assert ratio < 64
+
+
+async def test_same_venue_times_in_chronological_order(
+    hass: HomeAssistant, setup_integration
+) -> None:
+    """Times at one venue are listed in order of start, not as strings."""
+    entity = hass.data[BINARY_SENSOR_DOMAIN].get_entity(HOME_GAME)
+    events = [
+        process_event(
+            {"description": f"Game at Lumen Field. It starts at {clock}."}, today()
+        )
+        for clock in ("9:30 AM", "10:00 AM", "10:00 AM", "1:00 PM")
+    ]
+
+    assert entity._generate_summary(events) == (
+        "There are 4 events today at Lumen Field, "
+        "starting at 9:30 AM, 2 at 10:00 AM, and 1:00 PM"
+    )
+
+
+async def test_summary_built_once_per_refresh(
+    hass: HomeAssistant, setup_integration, stub_server: StubServer
+) -> None:
+    """State writes reuse the summary until the coordinator has new data."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    entity = hass.data[BINARY_SENSOR_DOMAIN].get_entity(HOME_GAME)
+
+    with patch.object(
+        entity, "_generate_summary", wraps=entity._generate_summary
+    ) as generate_summary:
+        for _ in range(5):
+            entity.async_write_ha_state()
+        assert generate_summary.call_count == 0
+
+        stub_server.payload = build_payload(3)
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        entity.async_write_ha_state()
+        assert generate_summary.call_count == 1
+
+    assert hass.states.get(HOME_GAME).attributes["event_count"] == 3
+
+
+async def test_past_day_reports_no_events(
+    hass: HomeAssistant, config_entry, stub_server: StubServer
+) -> None:
+    """Data for a day that has passed is not reported as today's."""
+    stub_server.payload = build_payload(2, day=today() - timedelta(days=1))
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get(HOME_GAME)
+    assert state.state == "off"
+    assert state.attributes["outdated"] is True
+    assert state.attributes["event_count"] == 0
+    assert hass.states.get("sensor.event_count").state == "0"
+
+
+async def test_midnight_drops_yesterdays_events(
+    hass: HomeAssistant,
+    config_entry,
+    stub_server: StubServer,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Once the day changes in Seattle the last data stops counting."""
+    # Without polling or start times only midnight can update the entities
+    hass.config_entries.async_update_entry(config_entry, pref_disable_polling=True)
+    stub_server.payload = {
+        "date": today().isoformat(),
+        "events": [{"name": "Concert", "description": "Concert at Lumen Field"}],
+    }
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.states.get(HOME_GAME).state == "on"
+
+    tomorrow = datetime.combine(today() + timedelta(days=1), time.min, SEATTLE_TZ)
+    freezer.move_to(tomorrow + timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(HOME_GAME).state == "off"
+    assert hass.states.get(HOME_GAME).attributes["outdated"] is True
+    assert hass.states.get("sensor.event_count").state == "0"
+    assert hass.states.get("sensor.event_concert").state == "unavailable"
+    assert len(stub_server.requests) == 1
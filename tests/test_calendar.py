@@ -0,0 +1,163 @@
+"""Tests for the Is There a Seattle Home Game Today? calendar."""
+
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.components.calendar import DOMAIN as CALENDAR_DOMAIN
+from homeassistant.core import HomeAssistant
+
+from custom_components.is_there_a_seattle_home_game_today.const import (
+    CONF_SEASON_FILES,
+    SEATTLE_TZ,
+)
+
+from .common import async_move_to
+from .conftest import StubServer
+
+CALENDAR = "calendar.seattle_home_games"
+DAY = date(2025, 7, 4)
+SEASON = "\r\n".join(
+    [
+        "BEGIN:VCALENDAR",
+        "BEGIN:VEVENT",
+        "SUMMARY:Kraken",
+        "LOCATION:Climate Pledge Arena",
+        "DTSTART:20250704T050000Z",
+        "END:VEVENT",
+        # The daily file for DAY replaces the season file's events
+        "BEGIN:VEVENT",
+        "SUMMARY:Storm",
+        "DTSTART;TZID=America/Los_Angeles:20250704T120000",
+        "END:VEVENT",
+        "BEGIN:VEVENT",
+        "SUMMARY:Fan Fest",
+        "DTSTART;VALUE=DATE:20250706",
+        "END:VEVENT",
+        "END:VCALENDAR",
+    ]
+)
+EVENTS = [
+    {
+        "name": "Mariners",
+        "description": "The Mariners play the Astros at T-Mobile Park. "
+        "It starts at 1:00 PM.",
+    },
+    {
+        "name": "Sounders",
+        "description": "The Sounders play the Timbers at Lumen Field. "
+        "It starts at 9:30 PM.",
+    },
+]
+
+
+def _at(hour: int, minute: int = 0, days: int = 0) -> datetime:
+    """Return a time of DAY, or of another day, in Seattle."""
+    return datetime.combine(DAY + timedelta(days=days), time(hour, minute), SEATTLE_TZ)
+
+
+@pytest.fixture
+async def calendar_setup(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    stub_server: StubServer,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Set up at 08:00 on DAY with a season file and the day's events."""
+    freezer.move_to(_at(8))
+    await hass.async_add_executor_job(
+        Path(hass.config.path("season.ics")).write_text, SEASON
+    )
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options={CONF_SEASON_FILES: "season.ics"},
+        pref_disable_polling=True,
+    )
+    stub_server.payload = {"date": DAY.isoformat(), "events": EVENTS}
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def _async_get_events(
+    hass: HomeAssistant, start: datetime, end: datetime
+) -> list[tuple[str, str, str]]:
+    """Return the summary, start and end of the calendar's events in a range."""
+    response = await hass.services.async_call(
+        CALENDAR_DOMAIN,
+        "get_events",
+        {"start_date_time": start, "end_date_time": end},
+        target={"entity_id": CALENDAR},
+        blocking=True,
+        return_response=True,
+    )
+    return [
+        (event["summary"], event["start"], event["end"])
+        for event in response[CALENDAR]["events"]
+    ]
+
+
+@pytest.mark.usefixtures("calendar_setup")
+@pytest.mark.parametrize(
+    ("start", "end", "events"),
+    [
+        # The season file's game runs on past midnight into DAY
+        (
+            _at(0),
+            _at(1),
+            [("Kraken", _at(22, days=-1).isoformat(), _at(1).isoformat())],
+        ),
+        (_at(1), _at(13), []),
+        (
+            _at(12),
+            _at(23),
+            [
+                ("Mariners", _at(13).isoformat(), _at(16).isoformat()),
+                ("Sounders", _at(21, 30).isoformat(), _at(0, 30, days=1).isoformat()),
+            ],
+        ),
+        (
+            _at(0, days=1),
+            _at(0, days=3),
+            [
+                ("Sounders", _at(21, 30).isoformat(), _at(0, 30, days=1).isoformat()),
+                ("Fan Fest", "2025-07-06", "2025-07-07"),
+            ],
+        ),
+        (_at(0, 30, days=1), _at(0, days=2), []),
+    ],
+)
+async def test_get_events(
+    hass: HomeAssistant,
+    start: datetime,
+    end: datetime,
+    events: list[tuple[str, str, str]],
+) -> None:
+    """Ranges return every event overlapping them, whichever day it started."""
+    assert await _async_get_events(hass, start, end) == events
+
+
+@pytest.mark.usefixtures("calendar_setup")
+async def test_event_around_midnight(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """The state shows the game under way past midnight, then the next event."""
+    steps = [
+        (_at(8), "off", "Mariners"),
+        (_at(13), "on", "Mariners"),
+        (_at(16), "off", "Sounders"),
+        (_at(21, 30), "on", "Sounders"),
+        (_at(0, days=1), "on", "Sounders"),
+        (_at(0, 30, days=1), "off", "Fan Fest"),
+        (_at(0, days=2), "on", "Fan Fest"),
+        (_at(0, days=3), "off", None),
+    ]
+    for when, state, message in steps:
+        await async_move_to(hass, freezer, when)
+        calendar = hass.states.get(CALENDAR)
+        assert (calendar.state, calendar.attributes.get("message")) == (
+            state,
+            message,
+        ), when
@@ -0,0 +1,117 @@
+"""Tests for the Is There a Seattle Home Game Today? config flow."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+from aiohttp import web
+
+from homeassistant.config_entries import SOURCE_USER
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.is_there_a_seattle_home_game_today.const import (
+    DATA_SEED,
+    DOMAIN,
+)
+
+from .common import build_payload
+from .conftest import StubServer
+
+
+async def _async_submit(hass: HomeAssistant) -> dict:
+    """Start the user flow and submit its form."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_USER}
+    )
+    assert result["type"] is FlowResultType.FORM
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
+    await hass.async_block_till_done()
+    return result
+
+
+async def test_flow_seeds_the_coordinator(
+    hass: HomeAssistant, stub_server: StubServer
+) -> None:
+    """The flow's fetch is the only request until the next poll."""
+    stub_server.payload = build_payload(2)
+
+    result = await _async_submit(hass)
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert len(stub_server.requests) == 1
+    assert DATA_SEED not in hass.data
+    assert hass.states.get("sensor.event_count").state == "2"
+
+
+async def test_server_error_is_not_retried(
+    hass: HomeAssistant, stub_server: StubServer
+) -> None:
+    """A failing server is reported after a single request."""
+
+    async def failing_handler(request: web.Request) -> web.Response:
+        return web.Response(status=503)
+
+    stub_server.handler = failing_handler
+
+    result = await _async_submit(hass)
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "cannot_connect"}
+    assert len(stub_server.requests) == 1
+    assert DATA_SEED not in hass.data
+
+
+async def test_slow_server_times_out(
+    hass: HomeAssistant, stub_server: StubServer
+) -> None:
+    """A server that does not answer is reported after the short timeout."""
+    release = asyncio.Event()
+
+    async def stalled_handler(request: web.Request) -> web.Response:
+        await release.wait()
+        return web.json_response(build_payload(0))
+
+    stub_server.handler = stalled_handler
+
+    with patch(
+        "custom_components.is_there_a_seattle_home_game_today.config_flow.VALIDATE_FETCH_TIMEOUT",
+        timedelta(seconds=0.2),
+    ):
+        async with asyncio.timeout(5):
+            result = await _async_submit(hass)
+    release.set()
+
+    assert result["errors"] == {"base": "cannot_connect"}
+    assert len(stub_server.requests) == 1
+
+
+async def test_invalid_payload(hass: HomeAssistant, stub_server: StubServer) -> None:
+    """A payload without events is refused and not handed on."""
+    stub_server.payload = {"date": "2025-07-04"}
+
+    result = await _async_submit(hass)
+
+    assert result["errors"] == {"base": "invalid_payload"}
+    assert DATA_SEED not in hass.data
+
+
+async def test_retry_after_an_error_seeds_once(
+    hass: HomeAssistant, stub_server: StubServer
+) -> None:
+    """Submitting again after an error uses the new fetch and consumes it."""
+    stub_server.payload = {"date": "2025-07-04"}
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
+    assert result["errors"] == {"base": "invalid_payload"}
+
+    stub_server.payload = build_payload(3)
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert len(stub_server.requests) == 2
+    assert DATA_SEED not in hass.data
+    assert hass.states.get("sensor.event_count").state == "3"
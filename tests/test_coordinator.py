@@ -0,0 +1,191 @@
+"""Tests for the Is There a Seattle Home Game Today? coordinator."""
+
+import asyncio
+from datetime import timedelta
+from time import monotonic
+from unittest.mock import patch
+
+from aiohttp import web
+import pytest
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from homeassistant.components.button import DOMAIN as BUTTON_DOMAIN, SERVICE_PRESS
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.is_there_a_seattle_home_game_today.const import (
+    DOMAIN,
+    EVENT_ADDED,
+    EVENT_CHANGED,
+    EVENT_REMOVED,
+    MIN_MANUAL_REFRESH_INTERVAL,
+)
+
+from .common import build_payload, today
+from .conftest import StubServer
+
+PRESSES = 300
+REFRESH_BUTTON = "button.manual_refresh"
+
+
+async def _async_press_all(hass: HomeAssistant) -> list:
+    """Press the refresh button PRESSES times at once."""
+    return await asyncio.gather(
+        *(
+            hass.services.async_call(
+                BUTTON_DOMAIN,
+                SERVICE_PRESS,
+                {ATTR_ENTITY_ID: REFRESH_BUTTON},
+                blocking=True,
+            )
+            for _ in range(PRESSES)
+        )
+    )
+
+
+async def test_concurrent_presses_share_one_fetch(
+    hass: HomeAssistant, setup_integration, stub_server: StubServer
+) -> None:
+    """Hundreds of presses while a fetch is in flight send a single request."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    received = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_handler(request: web.Request) -> web.Response:
+        received.set()
+        await release.wait()
+        return web.json_response(build_payload(3))
+
+    stub_server.handler = slow_handler
+    stub_server.requests.clear()
+
+    with patch(
+        "custom_components.is_there_a_seattle_home_game_today.coordinator.MIN_MANUAL_REFRESH_INTERVAL",
+        timedelta(0),
+    ):
+        presses = hass.async_create_task(_async_press_all(hass))
+        await received.wait()
+        # Every press has joined the fetch by the time the stub answers
+        for _ in range(10):
+            await asyncio.sleep(0)
+        release.set()
+        await presses
+
+    assert len(stub_server.requests) == 1
+    assert coordinator.data["event_count"] == 3
+    assert hass.states.get("sensor.event_count").state == "3"
+
+
+async def test_cancelled_refresh_does_not_cancel_shared_fetch(
+    hass: HomeAssistant, setup_integration, stub_server: StubServer
+) -> None:
+    """A caller giving up leaves the fetch running for the others."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    received = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_handler(request: web.Request) -> web.Response:
+        received.set()
+        await release.wait()
+        return web.json_response(build_payload(2))
+
+    stub_server.handler = slow_handler
+    stub_server.requests.clear()
+
+    first = hass.async_create_task(coordinator.async_refresh())
+    second = hass.async_create_task(coordinator.async_refresh())
+    await received.wait()
+    first.cancel()
+    release.set()
+    await second
+
+    assert first.cancelled()
+    assert len(stub_server.requests) == 1
+    assert coordinator.data["event_count"] == 2
+
+
+async def test_presses_right_after_a_fetch_are_ignored(
+    hass: HomeAssistant, setup_integration, stub_server: StubServer
+) -> None:
+    """Presses within the minimum interval of the last fetch send nothing."""
+    stub_server.requests.clear()
+
+    await _async_press_all(hass)
+
+    assert stub_server.requests == []
+
+
+async def test_press_after_the_interval_fetches(
+    hass: HomeAssistant, setup_integration, stub_server: StubServer
+) -> None:
+    """Once the minimum interval has passed a press fetches again."""
+    stub_server.requests.clear()
+    stub_server.payload = build_payload(1)
+
+    with patch(
+        "custom_components.is_there_a_seattle_home_game_today.coordinator.monotonic",
+        return_value=monotonic() + MIN_MANUAL_REFRESH_INTERVAL.total_seconds(),
+    ):
+        await hass.services.async_call(
+            BUTTON_DOMAIN,
+            SERVICE_PRESS,
+            {ATTR_ENTITY_ID: REFRESH_BUTTON},
+            blocking=True,
+        )
+
+    assert len(stub_server.requests) == 1
+    assert hass.states.get("sensor.event_count").state == "1"
+
+
+@pytest.mark.parametrize(
+    "corrected",
+    [
+        "The Seattle Mariners play the Houston Astros at T-Mobile Park. "
+        "It starts at 7:10 PM.",
+        "The Seattle Mariners play the Houston Astros at Safeco Field. "
+        "It starts at 6:40 PM.",
+        "The Seattle Mariners play the Houston Astros at Lumen Field. "
+        "It starts at 1:10 PM.",
+    ],
+)
+async def test_corrected_event_fires_changed(
+    hass: HomeAssistant, config_entry, stub_server: StubServer, corrected: str
+) -> None:
+    """A new time or venue updates the event rather than replacing it."""
+    original = {
+        "name": "Mariners vs. Astros",
+        "description": "The Seattle Mariners play the Houston Astros at "
+        "T-Mobile Park. It starts at 6:40 PM.",
+    }
+    stub_server.payload = {"date": today().isoformat(), "events": [original]}
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    entity_registry = er.async_get(hass)
+    [detail] = [
+        entry.entity_id
+        for entry in er.async_entries_for_config_entry(
+            entity_registry, config_entry.entry_id
+        )
+        if "_event_detail_" in entry.unique_id
+    ]
+
+    added = async_capture_events(hass, EVENT_ADDED)
+    removed = async_capture_events(hass, EVENT_REMOVED)
+    changed = async_capture_events(hass, EVENT_CHANGED)
+    stub_server.payload = {
+        "date": today().isoformat(),
+        "events": [{**original, "description": corrected}],
+    }
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert added == []
+    assert removed == []
+    assert len(changed) == 1
+    assert changed[0].data["event"]["description"] == corrected
+    assert changed[0].data["previous"]["description"] == original["description"]
+    state = hass.states.get(detail)
+    assert state.state == "Mariners vs. Astros"
+    assert state.attributes["description"] == corrected
@@ -0,0 +1,213 @@
+"""Tests for fetching the events file from a slow or misbehaving server."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from unittest.mock import patch
+
+import aiohttp
+from aiohttp import web
+import pytest
+
+from custom_components.is_there_a_seattle_home_game_today.const import (
+    FETCH_MAX_BYTES,
+    FETCH_TOTAL_TIMEOUT,
+)
+from custom_components.is_there_a_seattle_home_game_today.fetch import (
+    _TIMEOUT,
+    FetchError,
+    RetryableFetchError,
+    async_fetch,
+)
+
+from .conftest import StubServer
+
+FETCH = "custom_components.is_there_a_seattle_home_game_today.fetch"
+
+
+@pytest.fixture(autouse=True)
+def no_backoff():
+    """Retry without waiting."""
+    with patch(f"{FETCH}.FETCH_BACKOFF_BASE", 0):
+        yield
+
+
+@pytest.fixture
+async def session() -> AsyncGenerator[aiohttp.ClientSession]:
+    """Return a session with a single connection, so a leaked one blocks."""
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=1)
+    ) as session:
+        yield session
+
+
+async def _assert_connection_released(
+    session: aiohttp.ClientSession, stub_server: StubServer
+) -> None:
+    """Fetch once more, which needs the only connection to be free."""
+    stub_server.handler = None
+    async with asyncio.timeout(5):
+        result = await async_fetch(session, stub_server.url, retries=0)
+    assert result.status == 200
+
+
+async def test_fetch(session, stub_server: StubServer) -> None:
+    """A good response returns its body."""
+    result = await async_fetch(session, stub_server.url)
+
+    assert result.status == 200
+    assert b'"events": []' in result.body
+    assert len(stub_server.requests) == 1
+
+
+async def test_not_modified(session, stub_server: StubServer) -> None:
+    """A 304 returns an empty body."""
+
+    async def handler(request: web.Request) -> web.Response:
+        assert request.headers["If-None-Match"] == '"abc"'
+        return web.Response(status=304)
+
+    stub_server.handler = handler
+    result = await async_fetch(session, stub_server.url, {"If-None-Match": '"abc"'})
+
+    assert result.status == 304
+    assert result.body == b""
+    await _assert_connection_released(session, stub_server)
+
+
+@pytest.mark.parametrize("status", [429, 500, 503])
+async def test_retries_transient_errors(
+    session, stub_server: StubServer, status: int
+) -> None:
+    """Rate limiting and server errors are retried until a good response."""
+    statuses = [status, status]
+
+    async def handler(request: web.Request) -> web.Response:
+        if statuses:
+            return web.Response(status=statuses.pop())
+        return web.json_response({"date": "2025-07-04", "events": []})
+
+    stub_server.handler = handler
+    result = await async_fetch(session, stub_server.url, retries=2)
+
+    assert result.status == 200
+    assert len(stub_server.requests) == 3
+    await _assert_connection_released(session, stub_server)
+
+
+async def test_gives_up_after_retries(session, stub_server: StubServer) -> None:
+    """A server that keeps failing is tried retries + 1 times."""
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(status=502)
+
+    stub_server.handler = handler
+    with pytest.raises(RetryableFetchError):
+        await async_fetch(session, stub_server.url, retries=2)
+
+    assert len(stub_server.requests) == 3
+    await _assert_connection_released(session, stub_server)
+
+
+async def test_client_errors_are_not_retried(
+    session, stub_server: StubServer
+) -> None:
+    """A 404 fails straight away."""
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(status=404)
+
+    stub_server.handler = handler
+    with pytest.raises(FetchError) as err:
+        await async_fetch(session, stub_server.url, retries=2)
+
+    assert not isinstance(err.value, RetryableFetchError)
+    assert len(stub_server.requests) == 1
+    await _assert_connection_released(session, stub_server)
+
+
+async def test_trickling_response_times_out(
+    session, stub_server: StubServer
+) -> None:
+    """A body sent a byte at a time trips the total timeout."""
+    assert _TIMEOUT.total == FETCH_TOTAL_TIMEOUT.total_seconds()
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse()
+        await response.prepare(request)
+        try:
+            for _ in range(100):
+                await response.write(b" ")
+                await asyncio.sleep(0.05)
+        except ConnectionError:
+            pass
+        return response
+
+    stub_server.handler = handler
+    timeout = aiohttp.ClientTimeout(total=0.3, connect=1, sock_read=1)
+    with (
+        patch(f"{FETCH}._TIMEOUT", timeout),
+        pytest.raises(RetryableFetchError),
+    ):
+        async with asyncio.timeout(5):
+            await async_fetch(session, stub_server.url, retries=1)
+
+    assert len(stub_server.requests) == 2
+    await _assert_connection_released(session, stub_server)
+
+
+async def test_oversized_content_length(session, stub_server: StubServer) -> None:
+    """A response advertising more than the cap is refused."""
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(body=b" " * (FETCH_MAX_BYTES + 1))
+
+    stub_server.handler = handler
+    with pytest.raises(FetchError, match="exceeds"):
+        await async_fetch(session, stub_server.url)
+
+    assert len(stub_server.requests) == 1
+    await _assert_connection_released(session, stub_server)
+
+
+async def test_oversized_chunked_body(session, stub_server: StubServer) -> None:
+    """A body without a length is cut off once it passes the cap."""
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse()
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        try:
+            for _ in range(FETCH_MAX_BYTES // 65536 + 2):
+                await response.write(b" " * 65536)
+        except ConnectionError:
+            pass
+        return response
+
+    stub_server.handler = handler
+    with pytest.raises(FetchError, match="exceeds"):
+        await async_fetch(session, stub_server.url)
+
+    assert len(stub_server.requests) == 1
+    await _assert_connection_released(session, stub_server)
+
+
+async def test_malformed_response(session, stub_server: StubServer) -> None:
+    """A response cut off mid-body is retried like a connection error."""
+    statuses = ["broken"]
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        if not statuses:
+            return web.json_response({"date": "2025-07-04", "events": []})
+        statuses.pop()
+        response = web.StreamResponse(headers={"Content-Length": "1000"})
+        await response.prepare(request)
+        await response.write(b"{")
+        request.transport.close()
+        return response
+
+    stub_server.handler = handler
+    result = await async_fetch(session, stub_server.url, retries=1)
+
+    assert result.status == 200
+    assert len(stub_server.requests) == 2
+    await _assert_connection_released(session, stub_server)
@@ -0,0 +1,185 @@
+"""Tests for the event history log."""
+
+import asyncio
+import json
+from pathlib import Path
+import threading
+import time
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from custom_components.is_there_a_seattle_home_game_today.const import (
+    DOMAIN,
+    SERVICE_GET_HISTORY,
+)
+from custom_components.is_there_a_seattle_home_game_today.history import (
+    EventHistory,
+    append_history,
+    read_history,
+)
+
+from .common import today
+from .conftest import StubServer
+
+MARINERS = ["Mariners", "7:10 PM", "t_mobile_park"]
+KRAKEN = ["Kraken", "7:00 PM", "climate_pledge_arena"]
+SOUNDERS = ["Sounders", "7:30 PM", "lumen_field"]
+CONCERT = ["Concert", "8:00 PM", "The Crocodile"]
+# Two days, each corrected after it was first recorded
+RECORDS = [
+    {"date": "2025-07-01", "events": [MARINERS]},
+    {"date": "2025-07-01", "events": [MARINERS, KRAKEN]},
+    {"date": "2025-07-02", "events": [SOUNDERS]},
+    {"date": "2025-07-01", "events": [KRAKEN]},
+    {"date": "2025-07-02", "events": [SOUNDERS, CONCERT]},
+]
+
+
+def _history_path(hass: HomeAssistant, config_entry: MockConfigEntry) -> Path:
+    """Return the path of an entry's history log."""
+    return Path(
+        hass.config.path(STORAGE_DIR, f"{DOMAIN}.{config_entry.entry_id}.history")
+    )
+
+
+def _write_log(path: Path, lines: list[str]) -> None:
+    """Write a history log line by line."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(f"{line}\n" for line in lines))
+
+
+def test_last_record_of_a_day_wins() -> None:
+    """Replaying corrections counts each day once, as last recorded."""
+    history = EventHistory()
+    applied = [history.apply(record) for record in RECORDS]
+
+    assert applied == [True] * 5
+    assert not history.apply(RECORDS[-1])
+    assert len(history) == 2
+    assert history.records() == [RECORDS[3], RECORDS[4]]
+    # The Mariners were dropped from the first day, so their venue is gone
+    assert "t_mobile_park" not in history.by_venue
+    assert "t_mobile_park" not in history.by_venue_month
+
+
+def test_aggregates() -> None:
+    """Counts are kept per venue, weekday and month, in total or for a venue."""
+    history = EventHistory()
+    for record in RECORDS:
+        history.apply(record)
+    history.apply({"date": "2025-08-05", "events": [SOUNDERS]})
+
+    assert history.as_dict() == {
+        "days": 3,
+        "first_day": "2025-07-01",
+        "last_day": "2025-08-05",
+        "events": 4,
+        "by_venue": {"lumen_field": 2, "climate_pledge_arena": 1, "The Crocodile": 1},
+        "by_weekday": {"tuesday": 2, "wednesday": 2},
+        "by_month": {"2025-07": 3, "2025-08": 1},
+        "by_venue_month": {
+            "climate_pledge_arena": {"2025-07": 1},
+            "lumen_field": {"2025-07": 1, "2025-08": 1},
+            "The Crocodile": {"2025-07": 1},
+        },
+    }
+    assert history.as_dict("lumen_field") == {
+        "days": 3,
+        "first_day": "2025-07-01",
+        "last_day": "2025-08-05",
+        "venue": "lumen_field",
+        "events": 2,
+        "by_month": {"2025-07": 1, "2025-08": 1},
+    }
+
+
+def test_append_after_a_cut_short_write(tmp_path: Path) -> None:
+    """A torn last line is skipped and does not swallow the next record."""
+    path = tmp_path / "history"
+    path.write_text(json.dumps(RECORDS[0]) + "\n" + '{"date": "2025-07-0')
+
+    append_history(str(path), [RECORDS[2]])
+
+    assert read_history(str(path)) == [RECORDS[0], RECORDS[2]]
+
+
+async def test_replay_and_compaction(
+    hass: HomeAssistant, config_entry: MockConfigEntry, stub_server: StubServer
+) -> None:
+    """A log of mostly superseded records is rewritten with the latest ones."""
+    path = _history_path(hass, config_entry)
+    lines = [json.dumps(record) for record in RECORDS]
+    lines.insert(3, '{"date": "2025-07-0')
+    await hass.async_add_executor_job(_write_log, path, lines)
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    today_record = {"date": today().isoformat(), "events": []}
+    log = await hass.async_add_executor_job(read_history, str(path))
+    assert log == [RECORDS[3], RECORDS[4], today_record]
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_GET_HISTORY, {}, blocking=True, return_response=True
+    )
+    assert response["days"] == 3
+    assert response["events"] == 3
+    assert response["by_venue"] == {
+        "climate_pledge_arena": 1,
+        "lumen_field": 1,
+        "The Crocodile": 1,
+    }
+    assert response["by_weekday"] == {"tuesday": 1, "wednesday": 2}
+
+
+async def test_small_log_is_not_rewritten(
+    hass: HomeAssistant, config_entry: MockConfigEntry, stub_server: StubServer
+) -> None:
+    """A log without many superseded records is only appended to."""
+    path = _history_path(hass, config_entry)
+    lines = [json.dumps(record) for record in RECORDS[2:]]
+    await hass.async_add_executor_job(_write_log, path, lines)
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    log = await hass.async_add_executor_job(read_history, str(path))
+    assert log == [*RECORDS[2:], {"date": today().isoformat(), "events": []}]
+
+
+async def test_writes_do_not_overlap(
+    hass: HomeAssistant, config_entry: MockConfigEntry, stub_server: StubServer
+) -> None:
+    """Appends queued together reach the log one at a time, in order."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    calls = []
+    calls_lock = threading.Lock()
+
+    def slow_append(path: str, records: list[dict]) -> None:
+        with calls_lock:
+            calls.append(("start", records[0]["date"]))
+        time.sleep(0.05)
+        with calls_lock:
+            calls.append(("end", records[0]["date"]))
+
+    with patch(
+        "custom_components.is_there_a_seattle_home_game_today.coordinator.append_history",
+        slow_append,
+    ):
+        await asyncio.gather(
+            *(
+                coordinator._async_append_history([record])
+                for record in RECORDS[:3]
+            )
+        )
+
+    assert calls == [
+        (step, record["date"]) for record in RECORDS[:3] for step in ("start", "end")
+    ]
@@ -0,0 +1,148 @@
+"""Tests for setting up Is There a Seattle Home Game Today?"""
+
+import asyncio
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from aiohttp import web
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+
+from custom_components.is_there_a_seattle_home_game_today.const import (
+    DOMAIN,
+    STORAGE_VERSION,
+)
+from custom_components.is_there_a_seattle_home_game_today.parser import (
+    parse_event_date,
+    process_event,
+)
+
+from .common import build_payload, today
+from .conftest import StubServer
+
+HOME_GAME = "binary_sensor.is_there_a_seattle_home_game_today"
+
+
+def _store_snapshot(
+    hass_storage: dict, config_entry, count: int, day: date | None = None
+) -> None:
+    """Store the snapshot a previous run left with count events."""
+    payload = build_payload(count, day=day)
+    event_date = parse_event_date(payload["date"])
+    key = f"{DOMAIN}.{config_entry.entry_id}"
+    hass_storage[key] = {
+        "version": STORAGE_VERSION,
+        "key": key,
+        "data": {
+            "date": payload["date"],
+            "events": [
+                process_event(event, event_date).as_json_dict()
+                for event in payload["events"]
+            ],
+        },
+    }
+
+
+async def test_setup_and_unload(
+    hass: HomeAssistant, config_entry, stub_server: StubServer
+) -> None:
+    """The entities show the stub's events and go away on unload."""
+    stub_server.payload = build_payload(2)
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert len(stub_server.requests) == 1
+    assert hass.states.get("binary_sensor.is_there_a_seattle_home_game_today").state == "on"
+    assert hass.states.get("sensor.event_count").state == "2"
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert config_entry.state is ConfigEntryState.NOT_LOADED
+
+
+async def test_setup_does_not_wait_for_a_slow_server(
+    hass: HomeAssistant, hass_storage: dict, config_entry, stub_server: StubServer
+) -> None:
+    """With a snapshot setup finishes while the first fetch is still running."""
+    _store_snapshot(hass_storage, config_entry, 2)
+    received = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_handler(request: web.Request) -> web.Response:
+        received.set()
+        await release.wait()
+        return web.json_response(build_payload(3))
+
+    stub_server.handler = slow_handler
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    await received.wait()
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert hass.states.get(HOME_GAME).state == "on"
+    assert hass.states.get("sensor.event_count").state == "2"
+
+    release.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert hass.states.get("sensor.event_count").state == "3"
+
+
+async def test_setup_with_the_server_down(
+    hass: HomeAssistant, hass_storage: dict, config_entry, stub_server: StubServer
+) -> None:
+    """With a snapshot a failing server leaves the last good data in place."""
+    _store_snapshot(hass_storage, config_entry, 2)
+
+    async def failing_handler(request: web.Request) -> web.Response:
+        return web.Response(status=503)
+
+    stub_server.handler = failing_handler
+    with patch(
+        "custom_components.is_there_a_seattle_home_game_today.fetch.FETCH_BACKOFF_BASE",
+        0,
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert stub_server.requests
+    state = hass.states.get(HOME_GAME)
+    assert state.state == "on"
+    assert state.attributes["outdated"] is False
+    assert hass.states.get("sensor.event_count").state == "2"
+
+
+async def test_stale_snapshot_is_outdated(
+    hass: HomeAssistant, hass_storage: dict, config_entry, stub_server: StubServer
+) -> None:
+    """A snapshot from yesterday is flagged outdated until a fetch succeeds."""
+    _store_snapshot(hass_storage, config_entry, 2, day=today() - timedelta(days=1))
+
+    async def failing_handler(request: web.Request) -> web.Response:
+        return web.Response(status=503)
+
+    stub_server.handler = failing_handler
+    with patch(
+        "custom_components.is_there_a_seattle_home_game_today.fetch.FETCH_BACKOFF_BASE",
+        0,
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    state = hass.states.get(HOME_GAME)
+    assert state.state == "off"
+    assert state.attributes["outdated"] is True
+    assert hass.states.get("sensor.event_count").state == "0"
+
+    stub_server.handler = None
+    stub_server.payload = build_payload(1)
+    await hass.data[DOMAIN][config_entry.entry_id].async_refresh()
+    await hass.async_block_till_done()
+
+    state = hass.states.get(HOME_GAME)
+    assert state.state == "on"
+    assert state.attributes["outdated"] is False
@@ -0,0 +1,106 @@
+"""Tests for parsing event descriptions."""
+
+import json
+from pathlib import Path
+import random
+import re
+
+import pytest
+
+from custom_components.is_there_a_seattle_home_game_today.parser import (
+    extract_time_and_venue,
+    parse_event_date,
+    process_event,
+)
+
+DESCRIPTIONS = json.loads(
+    Path(__file__).with_name("fixtures").joinpath("descriptions.json").read_text()
+)
+
+# The patterns the coordinator tried one after another before the single-pass
+# scan. The dotted pattern ended in \b, which never matches between the final
+# "." and a space, so the scan checks for no word character instead.
+BASELINE_TIME_PATTERNS = [
+    r"starts\s+at\s+(\d{1,2}:\d{2}\s*[APap][Mm])",
+    r"at\s+(\d{1,2}:\d{2}\s*[APap][Mm])",
+    r"\b(\d{1,2}:\d{2}\s*[APap][Mm])\b",
+    r"\b(\d{1,2}:\d{2}\s*[ap]\.m\.)(?!\w)",
+]
+TOKENS = [
+    "at", "At", "that", "starts", "Starts", "restarts", "7:05", "12:30", "3:04",
+    "PM", "pm", "p.m.", "a.m.", "AM", "p.m.x", "pmx", "Lumen", "Field.", ".",
+    " ", "  ", "\t", "x", "7:05pm", "7:05p.m.", "the", "game", "is",
+]
+
+
+def baseline_time(description: str) -> str | None:
+    """Extract the time the way the coordinator used to."""
+    for pattern in BASELINE_TIME_PATTERNS:
+        if match := re.search(pattern, description, re.IGNORECASE):
+            time_str = re.sub(r"\s+", " ", match.group(1)).strip()
+            time_str = re.sub(r"([ap])\.m\.", r"\1m", time_str, flags=re.IGNORECASE)
+            return time_str.upper()
+    return None
+
+
+def _random_descriptions(count: int, seed: int = 1) -> list[str]:
+    """Return descriptions made of tokens that trip up time patterns."""
+    rng = random.Random(seed)
+    return [
+        "".join(
+            rng.choice(TOKENS) + rng.choice(["", " ", " ", "  "])
+            for _ in range(rng.randint(1, 12))
+        )
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("description", DESCRIPTIONS)
+def test_time_matches_baseline(description: str) -> None:
+    """Sample descriptions get the same time as with the old patterns."""
+    assert extract_time_and_venue(description)[0] == baseline_time(description)
+
+
+def test_time_matches_baseline_on_random_text() -> None:
+    """Random mixes of times, meridiems and "at" agree with the old patterns."""
+    diffs = []
+    for description in _random_descriptions(20000):
+        expected = baseline_time(description)
+        if (extracted := extract_time_and_venue(description)[0]) != expected:
+            diffs.append((description, expected, extracted))
+    assert diffs == []
+
+
+@pytest.mark.parametrize(
+    ("description", "venue"),
+    [
+        ("Concert tonight at Climate Pledge Arena", "Climate Pledge Arena"),
+        ("An event that ends late at The Gorge. It starts at 8:00 PM.", "The Gorge"),
+        ("The Mariners host the Yankees at 7:05 p.m. at Safeco.", "Safeco"),
+        ("Kraken game at 7:00pm", None),
+        ("Concert at The Showbox at 8:00 PM.", "The Showbox"),
+        ("Comedy night at Paramount Theatre, 8:00 PM", "Paramount Theatre"),
+        ("Event at 7pm at Showbox", "Showbox"),
+        ("Event at 7 PM at Showbox", "Showbox"),
+        ("Concert at The Showbox at 8 p.m. Doors open early.", "The Showbox"),
+    ],
+)
+def test_fallback_venue(description: str, venue: str | None) -> None:
+    """The "at <venue>." phrase leaves out times and "at" inside other words."""
+    assert extract_time_and_venue(description)[1] == venue
+
+
+def test_extract_benchmark(benchmark) -> None:
+    """Time extracting the time and venue of every sample description."""
+    results = benchmark(
+        lambda: [extract_time_and_venue(description) for description in DESCRIPTIONS]
+    )
+    assert len(results) == len(DESCRIPTIONS)
+
+
+def test_process_benchmark(benchmark) -> None:
+    """Time processing every sample description into an event."""
+    event_date = parse_event_date("2025-07-04")
+    events = [{"description": description} for description in DESCRIPTIONS]
+    results = benchmark(lambda: [process_event(event, event_date) for event in events])
+    assert len(results) == len(DESCRIPTIONS)
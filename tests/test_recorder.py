@@ -0,0 +1,247 @@
+"""Tests for what the recorder stores of Is There a Seattle Home Game Today?"""
+
+from datetime import UTC, date, datetime, timedelta
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+from pytest_homeassistant_custom_component.typing import RecorderInstanceContextManager
+
+from homeassistant.components.recorder import Recorder, get_instance
+from homeassistant.components.recorder.db_schema import (
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    statistics_during_period,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util import dt as dt_util
+
+from custom_components.is_there_a_seattle_home_game_today.binary_sensor import (
+    SeattleHomeGameBinarySensor,
+)
+from custom_components.is_there_a_seattle_home_game_today.const import (
+    CONF_LEAN_ATTRIBUTES,
+    DOMAIN,
+    SEATTLE_TZ,
+)
+from custom_components.is_there_a_seattle_home_game_today.history_statistics import (
+    statistic_id,
+)
+from custom_components.is_there_a_seattle_home_game_today.sensor import (
+    EventDetailSensor,
+)
+
+from .common import build_payload, today
+from .conftest import StubServer
+
+EVENTS = 20
+HOME_GAME = "binary_sensor.is_there_a_seattle_home_game_today"
+# The detail sensors of build_payload's "Event <n>" events
+EVENT_DETAIL_PREFIX = "sensor.event_event_"
+# A refresh an hour, each moving every event so every attribute changes
+REFRESHES = 24
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceContextManager,
+) -> None:
+    """Set up the recorder database before hass."""
+
+
+def _attribute_bytes(hass: HomeAssistant) -> int:
+    """Return the size of the attribute sets stored for the sensors lean mode trims."""
+    with session_scope(hass=hass, read_only=True) as session:
+        rows = (
+            session.query(StateAttributes.shared_attrs)
+            .join(States, States.attributes_id == StateAttributes.attributes_id)
+            .join(StatesMeta, StatesMeta.metadata_id == States.metadata_id)
+            .filter(
+                (StatesMeta.entity_id == HOME_GAME)
+                | StatesMeta.entity_id.startswith(EVENT_DETAIL_PREFIX)
+            )
+            .distinct()
+        )
+        return sum(len(shared_attrs) for (shared_attrs,) in rows)
+
+
+async def _async_bytes_for_a_day(
+    hass: HomeAssistant, config_entry, stub_server: StubServer, shift: int
+) -> int:
+    """Run a day's refreshes and return the attribute bytes they stored."""
+    await async_wait_recording_done(hass)
+    before = await get_instance(hass).async_add_executor_job(_attribute_bytes, hass)
+
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    for round_ in range(REFRESHES):
+        stub_server.payload = build_payload(EVENTS, shift + round_)
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    await async_wait_recording_done(hass)
+    after = await get_instance(hass).async_add_executor_job(_attribute_bytes, hass)
+    return after - before
+
+
+async def _async_set_lean(hass: HomeAssistant, config_entry, lean: bool) -> None:
+    """Change the lean attributes option, which reloads the entry."""
+    hass.config_entries.async_update_entry(
+        config_entry, options={CONF_LEAN_ATTRIBUTES: lean}
+    )
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+
+async def test_lean_mode_recorder_bytes(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    config_entry,
+    stub_server: StubServer,
+) -> None:
+    """The full event list and descriptions never reach the database."""
+    stub_server.payload = build_payload(EVENTS)
+    with patch(
+        "custom_components.is_there_a_seattle_home_game_today.coordinator.OUTBOUND_REQUEST_BURST",
+        4 * REFRESHES,
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        full = await _async_bytes_for_a_day(hass, config_entry, stub_server, 0)
+
+        await _async_set_lean(hass, config_entry, True)
+        lean = await _async_bytes_for_a_day(hass, config_entry, stub_server, REFRESHES)
+
+        # What was stored before the attributes were left out of the recorder
+        await _async_set_lean(hass, config_entry, False)
+        with (
+            patch.object(
+                SeattleHomeGameBinarySensor,
+                "_Entity__combined_unrecorded_attributes",
+                frozenset(),
+            ),
+            patch.object(
+                EventDetailSensor,
+                "_Entity__combined_unrecorded_attributes",
+                frozenset(),
+            ),
+        ):
+            await hass.config_entries.async_reload(config_entry.entry_id)
+            await hass.async_block_till_done(wait_background_tasks=True)
+            recorded = await _async_bytes_for_a_day(
+                hass, config_entry, stub_server, 2 * REFRESHES
+            )
+
+    # Lean mode saves nothing more in the database, the rounds only differ in
+    # the length of their start times
+    assert lean == pytest.approx(full, rel=0.1)
+    assert recorded > 2 * full
+
+
+
+def _write_history(path: Path, records: list[dict]) -> None:
+    """Write a history log of records."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+
+def _daily_counts(hass: HomeAssistant, ids: set[str]) -> dict[str, list[tuple]]:
+    """Return the day, state and sum of the imported rows of each statistic."""
+    start = datetime(2000, 1, 1, tzinfo=UTC)
+    rows = statistics_during_period(
+        hass, start, None, ids, "hour", None, {"state", "sum"}
+    )
+    return {
+        statistic: [
+            (
+                dt_util.utc_from_timestamp(row["start"]).astimezone(SEATTLE_TZ).date(),
+                row["state"],
+                row["sum"],
+            )
+            for row in statistic_rows
+        ]
+        for statistic, statistic_rows in rows.items()
+    }
+
+
+async def test_statistics_backfilled_once_then_from_the_changed_day(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    config_entry,
+    stub_server: StubServer,
+) -> None:
+    """The first start imports every day, later imports only the changed ones."""
+    day = today()
+    first, second = day - timedelta(days=3), day - timedelta(days=2)
+    path = Path(
+        hass.config.path(STORAGE_DIR, f"{DOMAIN}.{config_entry.entry_id}.history")
+    )
+    await hass.async_add_executor_job(
+        _write_history,
+        path,
+        [
+            {
+                "date": first.isoformat(),
+                "events": [
+                    ["Mariners", "7:10 PM", "t_mobile_park"],
+                    ["Sounders", "7:30 PM", "lumen_field"],
+                ],
+            },
+            {
+                "date": second.isoformat(),
+                "events": [["Sounders", "7:30 PM", "lumen_field"]],
+            },
+        ],
+    )
+    # The days of every import of the overall statistic
+    imported: list[list[date]] = []
+
+    def record_import(hass, metadata, statistics) -> None:
+        statistics = list(statistics)
+        if metadata["statistic_id"] == statistic_id():
+            imported.append([row["start"].date() for row in statistics])
+        async_add_external_statistics(hass, metadata, statistics)
+
+    ids = {statistic_id(), statistic_id("lumen_field")}
+    with patch(
+        "custom_components.is_there_a_seattle_home_game_today.history_statistics.async_add_external_statistics",
+        record_import,
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        await async_wait_recording_done(hass)
+
+        # The backfill, then today's day without events from the first refresh
+        assert imported == [[first, second], [day]]
+        assert await get_instance(hass).async_add_executor_job(
+            _daily_counts, hass, ids
+        ) == {
+            statistic_id(): [(first, 2, 2), (second, 1, 3), (day, 0, 3)],
+            statistic_id("lumen_field"): [(first, 1, 1), (second, 1, 2), (day, 0, 2)],
+        }
+
+        imported.clear()
+        await hass.config_entries.async_reload(config_entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert imported == []
+
+        stub_server.payload = build_payload(4)
+        await hass.data[DOMAIN][config_entry.entry_id].async_refresh()
+        await hass.async_block_till_done(wait_background_tasks=True)
+        await async_wait_recording_done(hass)
+
+    assert imported == [[day]]
+    assert await get_instance(hass).async_add_executor_job(
+        _daily_counts, hass, ids
+    ) == {
+        statistic_id(): [(first, 2, 2), (second, 1, 3), (day, 4, 7)],
+        statistic_id("lumen_field"): [(first, 1, 1), (second, 1, 2), (day, 1, 3)],
+    }
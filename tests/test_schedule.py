@@ -0,0 +1,128 @@
+"""Tests for the multi-day schedule."""
+
+from datetime import UTC, date, datetime, time, timedelta
+
+import pytest
+
+from custom_components.is_there_a_seattle_home_game_today.const import SEATTLE_TZ
+from custom_components.is_there_a_seattle_home_game_today.parser import (
+    process_event,
+)
+from custom_components.is_there_a_seattle_home_game_today.schedule import Schedule
+
+DAY = date(2025, 7, 4)
+
+
+def _at(hour: int, minute: int = 0, days: int = 0) -> datetime:
+    """Return a time of DAY, or of another day, in Seattle."""
+    return datetime.combine(DAY + timedelta(days=days), time(hour, minute), SEATTLE_TZ)
+
+
+def _event(name: str, clock: str | None, day: date):
+    """Return an event on day, starting at clock if given."""
+    description = f"{name} at Lumen Field."
+    if clock:
+        description += f" It starts at {clock}."
+    return process_event({"name": name, "description": description}, day)
+
+
+@pytest.fixture
+def schedule() -> Schedule:
+    """Return a schedule with a late game, an all-day event and a quiet day."""
+    yesterday = DAY - timedelta(days=1)
+    later = DAY + timedelta(days=3)
+    return Schedule(
+        {
+            yesterday: [_event("Late", "10:00 PM", yesterday)],
+            DAY: [
+                _event("Evening", "7:00 PM", DAY),
+                _event("All day", None, DAY),
+                _event("Afternoon", "1:00 PM", DAY),
+            ],
+            DAY + timedelta(days=1): [],
+            later: [_event("Later", "1:00 PM", later)],
+        }
+    )
+
+
+def test_days(schedule: Schedule) -> None:
+    """Days without events do not count, events are sorted untimed last."""
+    assert len(schedule) == 3
+    assert schedule.first_day == DAY - timedelta(days=1)
+    assert schedule.last_day == DAY + timedelta(days=3)
+    assert [
+        (day, [event.name for event in events])
+        for day, events in schedule.days_between(DAY, DAY + timedelta(days=4))
+    ] == [
+        (DAY, ["Afternoon", "Evening", "All day"]),
+        (DAY + timedelta(days=3), ["Later"]),
+    ]
+
+
+def test_empty_schedule() -> None:
+    """An empty schedule has no days and nothing to show."""
+    schedule = Schedule({})
+
+    assert len(schedule) == 0
+    assert schedule.first_day is None
+    assert schedule.events_between(_at(0), _at(0, days=1)) == []
+    assert schedule.current_or_next(_at(12)) is None
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "names"),
+    [
+        # Yesterday's late game runs on past midnight
+        (_at(0), _at(1), ["Late", "All day"]),
+        (_at(1), _at(2), ["All day"]),
+        # Ranges are half open
+        (_at(12), _at(13), ["All day"]),
+        (_at(16), _at(19), ["All day"]),
+        (_at(15, 59), _at(19, 1), ["Afternoon", "Evening", "All day"]),
+        (_at(21, 59), _at(0, days=3), ["Evening", "All day"]),
+        (_at(0, days=1), _at(0, days=3), []),
+        (_at(0, days=1), _at(0, days=4), ["Later"]),
+        (
+            _at(0, days=-1),
+            _at(0, days=7),
+            ["Late", "Afternoon", "Evening", "All day", "Later"],
+        ),
+        (_at(0, days=5), _at(0, days=6), []),
+    ],
+)
+def test_events_between(
+    schedule: Schedule, start: datetime, end: datetime, names: list[str]
+) -> None:
+    """Events overlapping the range are found, whichever day they started on."""
+    assert [event.name for _day, event in schedule.events_between(start, end)] == names
+
+
+def test_events_between_in_utc(schedule: Schedule) -> None:
+    """Ranges in another zone cover the same Seattle times."""
+    events = schedule.events_between(
+        _at(23, days=-1).astimezone(UTC), _at(0, 30).astimezone(UTC)
+    )
+
+    assert [(day, event.name) for day, event in events] == [
+        (DAY - timedelta(days=1), "Late"),
+        (DAY, "All day"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("now", "name"),
+    [
+        (_at(0, 30), "Late"),
+        (_at(1), "Afternoon"),
+        (_at(15, 59), "Afternoon"),
+        (_at(16), "Evening"),
+        (_at(22), "All day"),
+        (_at(0, days=1), "Later"),
+        (_at(16, days=3), None),
+    ],
+)
+def test_current_or_next(schedule: Schedule, now: datetime, name: str | None) -> None:
+    """The event under way wins, else the next one, all-day events last."""
+    found = schedule.current_or_next(now)
+
+    assert (found[1].name if found else None) == name
@@ -0,0 +1,177 @@
+"""Tests for the adaptive polling schedule."""
+
+from datetime import datetime, timedelta
+import json
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.is_there_a_seattle_home_game_today.const import (
+    DATA_SEED,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    FAST_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    SEATTLE_TZ,
+    STORAGE_VERSION,
+)
+from custom_components.is_there_a_seattle_home_game_today.fetch import FetchResult
+from custom_components.is_there_a_seattle_home_game_today.scheduler import (
+    PublishScheduler,
+)
+
+from .common import build_payload, today
+from .conftest import StubServer
+
+DAY = datetime(2025, 7, 4, tzinfo=SEATTLE_TZ)
+
+
+def _scheduler(*minutes: int) -> PublishScheduler:
+    """Return a scheduler that saw a publish at each minute of a past day."""
+    scheduler = PublishScheduler()
+    for day, minute in enumerate(minutes):
+        scheduler.record_change(DAY - timedelta(days=day + 1, minutes=-minute))
+    return scheduler
+
+
+@pytest.fixture(autouse=True)
+def no_jitter():
+    """Make intervals exact."""
+    with patch(
+        "custom_components.is_there_a_seattle_home_game_today.scheduler.SCAN_INTERVAL_JITTER",
+        0,
+    ):
+        yield
+
+
+def test_no_window_until_a_publish_is_seen() -> None:
+    """Without observations there is no window and polling is hourly."""
+    scheduler = PublishScheduler()
+
+    assert scheduler.publish_window is None
+    assert scheduler.next_interval(DAY.replace(hour=3), None) == DEFAULT_SCAN_INTERVAL
+
+
+def test_window_around_a_single_publish() -> None:
+    """One observation gives a window of the margin either side."""
+    assert _scheduler(3 * 60).publish_window == (2 * 60 + 30, 3 * 60 + 30)
+
+
+def test_one_late_publish_does_not_widen_the_window() -> None:
+    """A day published in the evening leaves the usual early window in place."""
+    usual = [2 * 60 + 41 + day % 5 * 4 for day in range(13)]
+    window = _scheduler(*usual, 21 * 60 + 30).publish_window
+
+    assert window == _scheduler(*usual).publish_window
+    assert window[1] < 4 * 60
+
+
+def test_same_day_changes_count_once() -> None:
+    """Corrections later in the day are not another publish."""
+    scheduler = PublishScheduler()
+    scheduler.record_change(DAY.replace(hour=3))
+    scheduler.record_change(DAY.replace(hour=21))
+
+    assert scheduler.as_dict()["observations"] == [3 * 60]
+
+
+def test_restore_round_trip() -> None:
+    """Persisted observations give the same window after a restart."""
+    scheduler = _scheduler(170, 180, 190)
+    restored = PublishScheduler()
+    restored.restore(json.loads(json.dumps(scheduler.as_dict())))
+
+    assert restored.publish_window == scheduler.publish_window
+
+
+@pytest.mark.parametrize(
+    ("now", "data_date", "interval"),
+    [
+        # Inside the 02:30 to 03:30 window without today's data
+        (DAY.replace(hour=3), "2025-07-03", FAST_SCAN_INTERVAL),
+        # Shortly before the window opens
+        (DAY.replace(hour=2, minute=10), "2025-07-03", timedelta(minutes=20)),
+        # Long before the window opens
+        (DAY.replace(hour=0), "2025-07-03", DEFAULT_SCAN_INTERVAL),
+        # The window passed without new data
+        (DAY.replace(hour=5), "2025-07-03", DEFAULT_SCAN_INTERVAL),
+        # Today's data is in, tomorrow's window is far away
+        (DAY.replace(hour=3, minute=5), "2025-07-04", MAX_SCAN_INTERVAL),
+        # Today's data is in and tomorrow's window is close
+        (DAY.replace(hour=22), "2025-07-04", timedelta(hours=4, minutes=30)),
+    ],
+)
+def test_next_interval(now: datetime, data_date: str, interval: timedelta) -> None:
+    """The interval follows the learned window and today's data."""
+    assert _scheduler(3 * 60).next_interval(now, data_date) == interval
+
+
+def test_jitter_stays_within_bounds() -> None:
+    """Jitter spreads intervals by the configured share, never below fast polling."""
+    scheduler = _scheduler(3 * 60)
+    now = DAY.replace(hour=5)
+    with patch(
+        "custom_components.is_there_a_seattle_home_game_today.scheduler.SCAN_INTERVAL_JITTER",
+        0.1,
+    ):
+        intervals = {scheduler.next_interval(now, None) for _ in range(50)}
+        fast = {scheduler.next_interval(now.replace(hour=3), None) for _ in range(50)}
+
+    assert len(intervals) > 1
+    assert all(
+        DEFAULT_SCAN_INTERVAL * 0.9 <= interval <= DEFAULT_SCAN_INTERVAL * 1.1
+        for interval in intervals
+    )
+    assert min(fast) == FAST_SCAN_INTERVAL
+
+
+async def test_first_fetch_after_restore_is_not_a_publish(
+    hass: HomeAssistant,
+    hass_storage: dict,
+    config_entry,
+    stub_server: StubServer,
+) -> None:
+    """New data on the refresh after a restart was not just published."""
+    hass_storage[f"{DOMAIN}.{config_entry.entry_id}"] = {
+        "version": STORAGE_VERSION,
+        "key": f"{DOMAIN}.{config_entry.entry_id}",
+        "data": {"date": today().isoformat(), "events": []},
+    }
+    stub_server.payload = build_payload(2)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    assert coordinator.data["event_count"] == 2
+    assert coordinator.publish_window is None
+
+    stub_server.payload = build_payload(3)
+    await coordinator.async_refresh()
+
+    assert coordinator.publish_window is not None
+
+
+async def test_first_fetch_after_seed_is_not_a_publish(
+    hass: HomeAssistant, config_entry, stub_server: StubServer
+) -> None:
+    """New data on the refresh after the config flow's fetch is not recorded."""
+    payload = build_payload(1)
+    hass.data[DATA_SEED] = (
+        FetchResult(200, {}, json.dumps(payload).encode()),
+        payload,
+    )
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    stub_server.payload = build_payload(2)
+    await coordinator.async_refresh()
+    assert coordinator.data["event_count"] == 2
+    assert coordinator.publish_window is None
+
+    stub_server.payload = build_payload(3)
+    await coordinator.async_refresh()
+
+    assert coordinator.publish_window is not None
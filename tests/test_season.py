@@ -0,0 +1,168 @@
+"""Tests for parsing season schedule files."""
+
+from datetime import date, datetime
+
+import pytest
+
+from custom_components.is_there_a_seattle_home_game_today.const import SEATTLE_TZ
+from custom_components.is_there_a_seattle_home_game_today.season import (
+    parse_ics,
+    parse_season_json,
+)
+
+
+def _calendar(*events: str) -> str:
+    """Wrap VEVENT bodies in a calendar with CRLF line endings."""
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0"]
+    for event in events:
+        lines += ["BEGIN:VEVENT", *event.strip().splitlines(), "END:VEVENT"]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
+
+
+def _only_event(text: str):
+    """Parse a calendar with a single event and return its day and event."""
+    days = parse_ics(text)
+    assert len(days) == 1
+    ((day, events),) = days.items()
+    assert len(events) == 1
+    return day, events[0]
+
+
+@pytest.mark.parametrize(
+    ("dtstart", "day", "start", "time"),
+    [
+        # Floating times are Seattle times
+        (
+            "DTSTART:20250704T191000",
+            date(2025, 7, 4),
+            datetime(2025, 7, 4, 19, 10, tzinfo=SEATTLE_TZ),
+            "7:10 PM",
+        ),
+        (
+            "DTSTART;TZID=America/New_York:20250704T190000",
+            date(2025, 7, 4),
+            datetime(2025, 7, 4, 16, 0, tzinfo=SEATTLE_TZ),
+            "4:00 PM",
+        ),
+        (
+            'DTSTART;TZID="America/Chicago":20250704T120500',
+            date(2025, 7, 4),
+            datetime(2025, 7, 4, 10, 5, tzinfo=SEATTLE_TZ),
+            "10:05 AM",
+        ),
+        # An unknown zone is taken as Seattle rather than dropping the event
+        (
+            "DTSTART;TZID=Nowhere/Special:20250704T190000",
+            date(2025, 7, 4),
+            datetime(2025, 7, 4, 19, 0, tzinfo=SEATTLE_TZ),
+            "7:00 PM",
+        ),
+        # UTC on the next day is still the evening before in Seattle
+        (
+            "DTSTART:20250705T020000Z",
+            date(2025, 7, 4),
+            datetime(2025, 7, 4, 19, 0, tzinfo=SEATTLE_TZ),
+            "7:00 PM",
+        ),
+        ("DTSTART;VALUE=DATE:20250706", date(2025, 7, 6), None, None),
+        ("DTSTART:20250706", date(2025, 7, 6), None, None),
+    ],
+)
+def test_ics_start(
+    dtstart: str, day: date, start: datetime | None, time: str | None
+) -> None:
+    """Start times in any zone become Seattle times, dates become all-day events."""
+    parsed_day, event = _only_event(
+        _calendar(f"SUMMARY:Mariners vs. Astros\n{dtstart}")
+    )
+
+    assert parsed_day == day
+    assert event.datetime == start
+    assert event.time == time
+
+
+def test_ics_folded_lines_and_escapes() -> None:
+    """Continuation lines are joined and text escapes undone."""
+    text = _calendar(
+        "SUMMARY:Sounders vs. Timbers\\, Cascadia Cup\n"
+        "DESCRIPTION:Gates open early.\\nBring a scarf\\; it gets cold at Lume\n"
+        " n Field.\n"
+        "LOCATION:Lumen Field\\, 800 Occidental Ave S\\\\Seattle\n"
+        "DTSTART:20250704T193000"
+    )
+
+    _day, event = _only_event(text)
+
+    assert event.name == "Sounders vs. Timbers, Cascadia Cup"
+    assert event.description == (
+        "Gates open early.\nBring a scarf; it gets cold at Lumen Field."
+    )
+    assert event.venue == "Lumen Field"
+    assert event.venue_id == "lumen_field"
+
+
+def test_ics_location_and_fallbacks() -> None:
+    """Unknown locations are kept, and a missing description uses the summary."""
+    days = parse_ics(
+        _calendar(
+            "SUMMARY:Concert\nLOCATION:The Crocodile\nDTSTART:20250704T200000",
+            "summary:Storm vs. Aces\ndtstart:20250704T190000\n"
+            "DESCRIPTION:The Storm play at KeyArena.",
+            # Without a start there is nothing to schedule
+            "SUMMARY:To be announced",
+        )
+    )
+
+    concert, storm = sorted(days[date(2025, 7, 4)], key=lambda event: event.name)
+    assert (concert.venue, concert.venue_id) == ("The Crocodile", None)
+    assert concert.description == "Concert"
+    assert (storm.name, storm.venue_id) == ("Storm vs. Aces", "climate_pledge_arena")
+    assert sum(len(events) for events in days.values()) == 2
+
+
+def test_ics_keys_ignore_the_start_time() -> None:
+    """A rescheduled event in a newer file keeps its key."""
+    before = _only_event(_calendar("SUMMARY:Kraken\nDTSTART:20250704T190000"))[1]
+    after = _only_event(_calendar("SUMMARY:Kraken\nDTSTART:20250704T193000"))[1]
+
+    assert before.key == after.key
+
+
+def test_season_json() -> None:
+    """Days shaped like the daily file are parsed, repeated dates merged."""
+    days = parse_season_json(
+        {
+            "days": [
+                {
+                    "date": "2025-07-04",
+                    "events": [
+                        {
+                            "name": "Mariners",
+                            "description": "At T-Mobile Park. It starts at 1:10 PM.",
+                        }
+                    ],
+                },
+                {"date": "2025-07-04", "events": [{"name": "Storm"}]},
+            ]
+        }
+    )
+
+    assert [event.name for event in days[date(2025, 7, 4)]] == ["Mariners", "Storm"]
+    assert days[date(2025, 7, 4)][0].datetime == datetime(
+        2025, 7, 4, 13, 10, tzinfo=SEATTLE_TZ
+    )
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"days": "2025-07-04"},
+        [{"date": "not a date", "events": []}],
+        [{"date": "2025-07-04"}],
+    ],
+)
+def test_season_json_invalid(payload) -> None:
+    """Files that are not a list of days are refused."""
+    with pytest.raises(ValueError):
+        parse_season_json(payload)
@@ -0,0 +1,51 @@
+"""Tests for the Is There a Seattle Home Game Today? sensors."""
+
+from datetime import timedelta
+
+from aiohttp import web
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.is_there_a_seattle_home_game_today.const import DOMAIN
+
+from .common import build_payload
+from .conftest import StubServer
+
+ETAG = '"v1"'
+HOME_GAME = "binary_sensor.is_there_a_seattle_home_game_today"
+LAST_POLL = "sensor.last_poll_time"
+
+
+async def test_last_poll_updates_on_not_modified(
+    hass: HomeAssistant,
+    config_entry,
+    stub_server: StubServer,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """An idle poll answered with 304 still moves the last poll time."""
+    payload = build_payload(2)
+
+    async def handler(request: web.Request) -> web.Response:
+        if request.headers.get("If-None-Match") == ETAG:
+            return web.Response(status=304)
+        return web.json_response(payload, headers={"ETag": ETAG})
+
+    stub_server.handler = handler
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    first_poll = hass.states.get(LAST_POLL)
+    home_game = hass.states.get(HOME_GAME)
+
+    freezer.tick(timedelta(minutes=10))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert stub_server.requests[-1].headers["If-None-Match"] == ETAG
+    assert coordinator.stats.latest.outcome == "not_modified"
+    polled_at = dt_util.parse_datetime(hass.states.get(LAST_POLL).state)
+    assert polled_at - dt_util.parse_datetime(first_poll.state) == timedelta(minutes=10)
+    # Entities that only render the events are left alone
+    assert hass.states.get(HOME_GAME).last_updated == home_game.last_updated
@@ -0,0 +1,59 @@
+"""Tests for the Is There a Seattle Home Game Today? actions."""
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.is_there_a_seattle_home_game_today.const import (
+    DOMAIN,
+    SERVICE_GET_EVENTS,
+    SERVICE_GET_HISTORY,
+)
+
+from .common import build_payload
+from .conftest import StubServer
+
+
+@pytest.fixture
+async def four_venues(
+    hass: HomeAssistant, config_entry, stub_server: StubServer
+) -> None:
+    """Set up with one event at each of the four known venues."""
+    stub_server.payload = build_payload(4)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize(
+    "venue", ["t_mobile_park", "T_Mobile_Park", "T-Mobile Park", "Safeco Field"]
+)
+async def test_get_events_by_venue(
+    hass: HomeAssistant, four_venues, venue: str
+) -> None:
+    """Venues can be given by their ID, name or an alias."""
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_EVENTS,
+        {"venue": venue},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert [event["venue"] for event in response["events"]] == ["T-Mobile Park"]
+
+
+@pytest.mark.parametrize("venue", ["t_mobile_park", "T-Mobile Park", "Safeco Field"])
+async def test_get_history_by_venue(
+    hass: HomeAssistant, four_venues, venue: str
+) -> None:
+    """History is counted per venue ID, whichever way the venue is given."""
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        {"venue": venue},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["venue"] == "t_mobile_park"
+    assert response["events"] == 1
@@ -0,0 +1,187 @@
+"""Tests for the callbacks at event start and end times and traffic windows."""
+
+from datetime import date, datetime, time, timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.is_there_a_seattle_home_game_today.const import (
+    DOMAIN,
+    SEATTLE_TZ,
+)
+
+from .common import async_move_to
+from .conftest import StubServer
+
+DAY = date(2025, 7, 4)
+GAME_IN_PROGRESS = "binary_sensor.game_in_progress"
+TRAFFIC_IMPACTED = "binary_sensor.traffic_impacted"
+TRAFFIC_IMPACTED_SOON = "binary_sensor.traffic_impacted_soon"
+EVENTS = [
+    {
+        "name": "Mariners",
+        "description": "The Mariners play the Astros at T-Mobile Park. "
+        "It starts at 1:00 PM.",
+    },
+    {
+        "name": "Kraken",
+        "description": "The Kraken play the Canucks at Climate Pledge Arena. "
+        "It starts at 3:00 PM.",
+    },
+    {
+        "name": "Sounders",
+        "description": "The Sounders play the Timbers at Lumen Field. "
+        "It starts at 9:30 PM.",
+    },
+]
+
+
+def _at(hour: int, minute: int = 0, days: int = 0) -> datetime:
+    """Return a time of DAY, or of a later day, in Seattle."""
+    return datetime.combine(DAY + timedelta(days=days), time(hour, minute), SEATTLE_TZ)
+
+
+async def _async_setup_day(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    stub_server: StubServer,
+    freezer: FrozenDateTimeFactory,
+    events: list[dict],
+) -> None:
+    """Set up at 08:00 on DAY, with polling off so only the timeline updates."""
+    freezer.move_to(_at(8))
+    hass.config_entries.async_update_entry(config_entry, pref_disable_polling=True)
+    stub_server.payload = {"date": DAY.isoformat(), "events": events}
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_game_in_progress_flips_at_starts_and_ends(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    stub_server: StubServer,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Game In Progress follows every start and estimated end, past midnight."""
+    await _async_setup_day(hass, config_entry, stub_server, freezer, EVENTS)
+
+    steps = [
+        (_at(8), "off", []),
+        (_at(12, 59), "off", []),
+        (_at(13), "on", ["Mariners"]),
+        (_at(15), "on", ["Mariners", "Kraken"]),
+        # The Mariners end while the Kraken are still playing
+        (_at(16), "on", ["Kraken"]),
+        (_at(18), "off", []),
+        (_at(21, 30), "on", ["Sounders"]),
+        (_at(0, days=1), "on", ["Sounders"]),
+        (_at(0, 30, days=1), "off", []),
+    ]
+    for when, state, names in steps:
+        await async_move_to(hass, freezer, when)
+        game = hass.states.get(GAME_IN_PROGRESS)
+        assert (game.state, game.attributes["events"]) == (state, names), when
+
+    assert len(stub_server.requests) == 1
+
+
+async def test_new_data_moves_the_callbacks(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    stub_server: StubServer,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A start time moved by a refresh replaces the old callbacks."""
+    await _async_setup_day(hass, config_entry, stub_server, freezer, EVENTS[:1])
+    stub_server.payload = {
+        "date": DAY.isoformat(),
+        "events": [
+            {
+                "name": "Mariners",
+                "description": "The Mariners play the Astros at T-Mobile Park. "
+                "It starts at 2:00 PM.",
+            }
+        ],
+    }
+    await hass.data[DOMAIN][config_entry.entry_id].async_refresh()
+    await hass.async_block_till_done()
+
+    await async_move_to(hass, freezer, _at(13))
+    assert hass.states.get(GAME_IN_PROGRESS).state == "off"
+    await async_move_to(hass, freezer, _at(14))
+    assert hass.states.get(GAME_IN_PROGRESS).state == "on"
+    await async_move_to(hass, freezer, _at(17))
+    assert hass.states.get(GAME_IN_PROGRESS).state == "off"
+
+
+async def test_midnight_is_rescheduled_every_day(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    stub_server: StubServer,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Listeners hear about every day change, not just the first."""
+    await _async_setup_day(hass, config_entry, stub_server, freezer, [])
+    timeline = hass.data[DOMAIN][config_entry.entry_id].timeline
+    calls = []
+    timeline.async_add_listener(lambda: calls.append(True))
+
+    for days in (1, 2, 3):
+        await async_move_to(hass, freezer, _at(0, days=days) - timedelta(seconds=1))
+        assert len(calls) == days - 1
+        await async_move_to(hass, freezer, _at(0, days=days))
+        assert len(calls) == days
+
+
+async def test_traffic_sensors_flip_at_window_edges(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    stub_server: StubServer,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Traffic sensors follow the merged windows and the look-ahead before them."""
+    await _async_setup_day(hass, config_entry, stub_server, freezer, EVENTS)
+
+    # The Mariners' and Kraken's windows overlap into 11:30 to 19:00, the
+    # Sounders' runs from 19:30 to 02:00
+    steps = [
+        (_at(8), "off", "off"),
+        (_at(10, 59), "off", "off"),
+        (_at(11), "off", "on"),
+        (_at(11, 30), "on", "on"),
+        (_at(17), "on", "on"),
+        # The gap between the windows is shorter than the look-ahead
+        (_at(19), "off", "on"),
+        (_at(19, 30), "on", "on"),
+        (_at(2, days=1), "off", "off"),
+    ]
+    for when, impacted, soon in steps:
+        await async_move_to(hass, freezer, when)
+        assert (
+            hass.states.get(TRAFFIC_IMPACTED).state,
+            hass.states.get(TRAFFIC_IMPACTED_SOON).state,
+        ) == (impacted, soon), when
+
+    assert len(stub_server.requests) == 1
+
+
+async def test_traffic_window_attributes(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    stub_server: StubServer,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """The window attributes move on to the next window when one closes."""
+    await _async_setup_day(hass, config_entry, stub_server, freezer, EVENTS)
+
+    soon = hass.states.get(TRAFFIC_IMPACTED_SOON)
+    assert soon.attributes["window_start"] == _at(11, 30).isoformat()
+    assert soon.attributes["window_end"] == _at(19).isoformat()
+    assert soon.attributes["lookahead_minutes"] == 30
+
+    await async_move_to(hass, freezer, _at(19))
+    impacted = hass.states.get(TRAFFIC_IMPACTED)
+    assert impacted.attributes["window_start"] == _at(19, 30).isoformat()
+    assert impacted.attributes["window_end"] == _at(2, days=1).isoformat()
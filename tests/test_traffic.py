@@ -0,0 +1,132 @@
+"""Tests for the traffic impact windows."""
+
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from custom_components.is_there_a_seattle_home_game_today.const import (
+    CONF_ARRIVAL_MINUTES,
+    CONF_EGRESS_MINUTES,
+    SEATTLE_TZ,
+)
+from custom_components.is_there_a_seattle_home_game_today.parser import (
+    process_event,
+)
+from custom_components.is_there_a_seattle_home_game_today.traffic import (
+    TrafficWindows,
+    venue_windows,
+)
+
+DAY = date(2025, 7, 4)
+LOOKAHEAD = timedelta(minutes=30)
+
+
+def _at(hour: int, minute: int = 0, days: int = 0) -> datetime:
+    """Return a time of DAY, or of a later day, in Seattle."""
+    return datetime.combine(DAY + timedelta(days=days), time(hour, minute), SEATTLE_TZ)
+
+
+def test_overlapping_windows_merge() -> None:
+    """Overlapping and touching intervals become one window, in order."""
+    traffic = TrafficWindows(
+        [
+            (_at(19, 30), _at(2, days=1)),
+            (_at(13, 30), _at(19)),
+            (_at(11, 30), _at(17)),
+            # Touches the end of the window before it
+            (_at(19), _at(19, 15)),
+            # Inside a window already covered
+            (_at(12), _at(13)),
+        ]
+    )
+
+    assert traffic.windows == [
+        (_at(11, 30), _at(19, 15)),
+        (_at(19, 30), _at(2, days=1)),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("when", "current", "upcoming"),
+    [
+        (_at(8), None, (_at(11, 30), _at(19))),
+        (_at(11, 30), (_at(11, 30), _at(19)), (_at(11, 30), _at(19))),
+        (_at(18, 59), (_at(11, 30), _at(19)), (_at(11, 30), _at(19))),
+        # The end of a window is not part of it
+        (_at(19), None, (_at(19, 30), _at(2, days=1))),
+        (_at(1, days=1), (_at(19, 30), _at(2, days=1)), (_at(19, 30), _at(2, days=1))),
+        (_at(2, days=1), None, None),
+    ],
+)
+def test_window_lookups(
+    when: datetime,
+    current: tuple[datetime, datetime] | None,
+    upcoming: tuple[datetime, datetime] | None,
+) -> None:
+    """The current window and the next one are found on either side of the edges."""
+    traffic = TrafficWindows([(_at(11, 30), _at(19)), (_at(19, 30), _at(2, days=1))])
+
+    assert traffic.window_at(when) == current
+    assert traffic.next_window(when) == upcoming
+
+
+@pytest.mark.parametrize(
+    ("when", "impacted"),
+    [
+        (_at(10, 59), False),
+        (_at(11), True),
+        (_at(19), True),
+        (_at(2, days=1), False),
+    ],
+)
+def test_impacted_within_the_lookahead(when: datetime, impacted: bool) -> None:
+    """A window opening within the look-ahead counts, one further away does not."""
+    traffic = TrafficWindows([(_at(11, 30), _at(19)), (_at(19, 30), _at(2, days=1))])
+
+    assert traffic.impacted_within(when, LOOKAHEAD) is impacted
+
+
+def test_boundaries() -> None:
+    """Every window has a flip at its start, its end and the look-ahead before it."""
+    traffic = TrafficWindows([(_at(11, 30), _at(19)), (_at(19, 30), _at(2, days=1))])
+
+    assert traffic.boundaries(LOOKAHEAD) == {
+        _at(11),
+        _at(11, 30),
+        _at(19),
+        _at(19, 30),
+        _at(2, days=1),
+    }
+
+
+def test_venue_windows() -> None:
+    """Known venues have their own windows, which options can override."""
+    assert venue_windows("lumen_field", {}) == (
+        timedelta(minutes=120),
+        timedelta(minutes=90),
+    )
+    assert venue_windows(
+        "lumen_field", {CONF_ARRIVAL_MINUTES.format("lumen_field"): 45}
+    ) == (timedelta(minutes=45), timedelta(minutes=90))
+    assert venue_windows(None, {}) == (timedelta(minutes=60), timedelta(minutes=60))
+
+
+def test_from_events() -> None:
+    """Windows run from arrival before the start to egress after the end."""
+    events = [
+        process_event(
+            {"description": "The Sounders play at Lumen Field. It starts at 7:00 PM."},
+            DAY,
+        ),
+        process_event(
+            {"description": "A concert at the Moore Theatre. It starts at 8:00 PM."},
+            DAY,
+        ),
+        process_event({"description": "Something happens today."}, DAY),
+    ]
+
+    traffic = TrafficWindows.from_events(
+        events, {CONF_EGRESS_MINUTES.format("lumen_field"): 30}
+    )
+
+    assert traffic.windows == [(_at(17), _at(0, days=1))]